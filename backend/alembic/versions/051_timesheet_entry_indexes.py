@@ -0,0 +1,33 @@
+"""Add compound/partial indexes for timesheet_entries hot filters
+
+Revision ID: 051_timesheet_indexes
+Revises: 050_calendar_pending_mods
+Create Date: 2026-10-16
+
+ix_ts_org_user_date serves the per-user list/summary endpoints, which all
+filter on (org_id, user_id) plus a date range and order by date DESC.
+ix_ts_org_submitted is a partial index for the manager approval queue.
+"""
+
+from alembic import op
+
+revision = "051_timesheet_indexes"
+down_revision = "050_calendar_pending_mods"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_ts_org_user_date "
+        "ON timesheet_entries (org_id, user_id, date DESC)"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_ts_org_submitted "
+        "ON timesheet_entries (org_id, submitted_at) WHERE status = 'submitted'"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_ts_org_submitted")
+    op.execute("DROP INDEX IF EXISTS ix_ts_org_user_date")
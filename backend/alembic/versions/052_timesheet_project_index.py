@@ -0,0 +1,27 @@
+"""Add partial (org_id, project) index for the timesheet project picker
+
+Revision ID: 052_timesheet_project_index
+Revises: 051_timesheet_indexes
+Create Date: 2026-10-16
+
+Lets GET /timesheets/projects answer its DISTINCT ... ORDER BY project from
+the index instead of scanning and sorting the org's entries.
+"""
+
+from alembic import op
+
+revision = "052_timesheet_project_index"
+down_revision = "051_timesheet_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_ts_org_project "
+        "ON timesheet_entries (org_id, project) WHERE activity_type = 'project'"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_ts_org_project")
@@ -0,0 +1,26 @@
+"""Index the login lookup keys on users_legacy and orgs
+
+Revision ID: 053_login_lookup_indexes
+Revises: 052_timesheet_project_index
+Create Date: 2026-10-16
+
+POST /auth/login finds the user by email and checks org_code; both tables
+predate these migrations, so make sure the lookups are indexed.
+"""
+
+from alembic import op
+
+revision = "053_login_lookup_indexes"
+down_revision = "052_timesheet_project_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE INDEX IF NOT EXISTS ix_users_legacy_email ON users_legacy (email)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_orgs_org_code ON orgs (org_code)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_orgs_org_code")
+    op.execute("DROP INDEX IF EXISTS ix_users_legacy_email")
@@ -0,0 +1,30 @@
+"""Add a BRIN index on audit_log.created_at
+
+Revision ID: 054_audit_log_created_at_brin
+Revises: 053_login_lookup_indexes
+Create Date: 2026-10-16
+
+audit_log is append-only and rows arrive in created_at order, so a BRIN index
+covers time-range scans and retention deletes for a few pages of storage and
+almost no insert cost. Monthly partitioning was considered but would need the
+primary key to include created_at and a partition-maintenance job; revisit if
+retention deletes become a problem.
+"""
+
+from alembic import op
+
+revision = "054_audit_log_created_at_brin"
+down_revision = "053_login_lookup_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_audit_log_created_at_brin "
+        "ON audit_log USING BRIN (created_at)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_audit_log_created_at_brin")
@@ -0,0 +1,38 @@
+"""Store the document_chunks tsvector and index it
+
+Revision ID: 055_document_chunks_content_tsv
+Revises: 054_audit_log_created_at_brin
+Create Date: 2026-10-16
+
+KB search ranked chunks with ts_rank(to_tsvector('english', content), ...),
+re-tokenizing every matching chunk on every query. A stored generated column
+is computed once per write; its GIN index replaces the old expression index.
+"""
+
+from alembic import op
+
+revision = "055_document_chunks_content_tsv"
+down_revision = "054_audit_log_created_at_brin"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "ALTER TABLE document_chunks ADD COLUMN IF NOT EXISTS content_tsv tsvector "
+        "GENERATED ALWAYS AS (to_tsvector('english', content)) STORED"
+    )
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_document_chunks_content_tsv "
+        "ON document_chunks USING GIN (content_tsv)"
+    )
+    op.execute("DROP INDEX IF EXISTS idx_document_chunks_fts")
+
+
+def downgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS idx_document_chunks_fts "
+        "ON document_chunks USING GIN (to_tsvector('english', content))"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_document_chunks_content_tsv")
+    op.execute("ALTER TABLE document_chunks DROP COLUMN IF EXISTS content_tsv")
@@ -0,0 +1,28 @@
+"""Trigram index for the KB ILIKE fallback
+
+Revision ID: 056_document_chunks_content_trgm
+Revises: 055_document_chunks_content_tsv
+Create Date: 2026-10-16
+
+When full-text search finds nothing, KB search falls back to
+content ILIKE '%word%', which otherwise scans every chunk in the org.
+"""
+
+from alembic import op
+
+revision = "056_document_chunks_content_trgm"
+down_revision = "055_document_chunks_content_tsv"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_document_chunks_content_trgm "
+        "ON document_chunks USING GIN (content gin_trgm_ops)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_document_chunks_content_trgm")
@@ -0,0 +1,28 @@
+"""Add (org_id, is_active, created_at DESC) index for the module list
+
+Revision ID: 057_guided_modules_list_index
+Revises: 056_document_chunks_content_trgm
+Create Date: 2026-10-16
+
+list_modules filters on org_id (the org's own modules OR the global NULL
+ones) and is_active, newest first; both OR arms can be served from this
+index in created_at order.
+"""
+
+from alembic import op
+
+revision = "057_guided_modules_list_index"
+down_revision = "056_document_chunks_content_trgm"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_guided_modules_org_active_created "
+        "ON guided_modules (org_id, is_active, created_at DESC)"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_guided_modules_org_active_created")
@@ -0,0 +1,28 @@
+"""Add (org_id, normalized name) index on users_legacy for payroll matching
+
+Revision ID: 058_users_legacy_normalized_name
+Revises: 057_guided_modules_list_index
+Create Date: 2026-10-16
+
+Payroll uploads look users up by lower-cased, whitespace-collapsed name
+within the org; the expression here must match the one in
+payroll_parser._match_employees.
+"""
+
+from alembic import op
+
+revision = "058_users_legacy_normalized_name"
+down_revision = "057_guided_modules_list_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_users_legacy_org_normalized_name "
+        r"ON users_legacy (org_id, lower(btrim(regexp_replace(name, '\s+', ' ', 'g'))))"
+    )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_users_legacy_org_normalized_name")
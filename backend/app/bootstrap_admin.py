@@ -47,6 +47,15 @@ def _validate_org_code(code: str) -> str:
 def bootstrap_super_admin(email: str, password: str, name: str, org_name: str, org_code: str) -> None:
     db = SessionLocal()
     try:
+        # Check for the user first (role column only) so a re-run never hashes
+        # the password or touches the organization table.
+        existing = db.query(User.role).filter(User.email == email).first()
+        if existing:
+            if str(existing.role) != "super_admin":
+                raise ValueError(f"User {email} already exists with role {existing.role}; refusing to repurpose automatically.")
+            logger.info("Super admin already exists for %s. No new credentials were created.", email)
+            return
+
         org = db.query(Organization).filter(Organization.org_code == org_code).first()
         if not org:
             org = Organization(name=org_name, org_code=org_code, is_active=True)
@@ -54,14 +63,6 @@ def bootstrap_super_admin(email: str, password: str, name: str, org_name: str, o
             db.flush()
             logger.info("Created bootstrap organization: %s (%s)", org.name, org.org_code)
 
-        user = db.query(User).filter(User.email == email).first()
-        if user:
-            if str(user.role) != "super_admin":
-                raise ValueError(f"User {email} already exists with role {user.role}; refusing to repurpose automatically.")
-            logger.info("Super admin already exists for %s. No new credentials were created.", email)
-            db.rollback()
-            return
-
         user = User(
             email=email,
             password_hash=_hash_password(password),
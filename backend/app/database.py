@@ -1,6 +1,7 @@
 import os
 import re
 import logging
+import orjson
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from dotenv import load_dotenv
@@ -41,7 +42,27 @@ if _needs_ssl or "render.com" in _raw_url or "oregon-postgres" in _raw_url or "d
 
 _logger.info("DB URL normalized: %s...  ssl=%s", DATABASE_URL[:50], bool(_connect_args))
 
-engine = create_engine(DATABASE_URL, pool_pre_ping=True, connect_args=_connect_args)
+# Sync endpoints run in a worker threadpool sized to DB_POOL_SIZE + DB_MAX_OVERFLOW
+# (THREADPOOL_SIZE in main.py), so every running handler can get a connection.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+
+
+def _json_dumps(value) -> str:
+    # JSON/JSONB binds (audit details, module steps, ...) go through orjson;
+    # non-str keys are stringified like the stdlib encoder does.
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+engine = create_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    connect_args=_connect_args,
+    json_serializer=_json_dumps,
+    json_deserializer=orjson.loads,
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
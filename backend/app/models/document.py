@@ -2,10 +2,10 @@ import enum
 import uuid
 
 from sqlalchemy import (
-    Column, Integer, String, Text, Boolean, DateTime, ForeignKey,
+    Column, Computed, Integer, String, Text, Boolean, DateTime, ForeignKey,
 )
-from sqlalchemy.dialects.postgresql import JSONB, UUID
-from sqlalchemy.orm import relationship
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 
 from app.database import Base
@@ -79,6 +79,8 @@ class DocumentChunk(Base):
     chunk_index = Column(Integer, nullable=False)
     content = Column(Text, nullable=False)
     token_count = Column(Integer, nullable=True)
+    # DB: generated, GIN-indexed; only used inside search SQL
+    content_tsv = deferred(Column(TSVECTOR, Computed("to_tsvector('english', content)", persisted=True)))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     document = relationship("Document", back_populates="chunks")
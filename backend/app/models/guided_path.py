@@ -3,6 +3,7 @@ from sqlalchemy import (
     Column, Integer, String, Text, Boolean, DateTime, ForeignKey
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PGUUID
+from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
 
@@ -75,3 +76,6 @@ class GuidedPathSession(Base):
 
     theme_category = Column(String(50), nullable=True)
     available_time = Column(Integer, nullable=True)  # minutes
+
+    # Load explicitly (get_session(..., with_module=True)); lazy loads raise.
+    module = relationship("GuidedModule", lazy="raise")
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, DateTime, Date, Numeric
+from sqlalchemy import Column, String, Text, Boolean, DateTime, Date, Numeric, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
 
@@ -28,3 +28,10 @@ class TimesheetEntry(Base):
     leave_application_id = Column(UUID(as_uuid=True), nullable=True)                     # traceability back to leave_applications
     created_at           = Column(DateTime(timezone=True), server_default=func.now())
     updated_at           = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index("ix_ts_org_user_date", "org_id", "user_id", text("date DESC")),
+        Index("ix_ts_org_status", "org_id", "status"),
+        Index("ix_ts_org_submitted", "org_id", "submitted_at", postgresql_where=text("status = 'submitted'")),
+        Index("ix_ts_org_project", "org_id", "project", postgresql_where=text("activity_type = 'project'")),
+    )
@@ -6,11 +6,13 @@ import os
 import hashlib
 import secrets
 import logging
+import re
 from datetime import timedelta
 from typing import Optional
 
 from fastapi import APIRouter, Depends, Header, HTTPException
 from pydantic import BaseModel
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.database import get_db
@@ -18,14 +20,22 @@ from app.models.user import Organization, User
 from app.services.auth import (
     create_access_token,
     decode_access_token,
+    get_password_hash,
+    needs_rehash,
     verify_password as _verify_password,
 )
+from app.services.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 JWT_EXPIRY_HOURS = int(os.getenv("JWT_EXPIRY_HOURS", "24"))
+_BEARER_RE = re.compile(r"^Bearer\s+(\S+)\s*$", re.I)
+
+# org_code -> (org_id, name) for /verify-code. Only hits are cached, so new
+# orgs resolve immediately; super-admin edits call invalidate_org_code.
+_org_code_cache = TTLCache(maxsize=1024, ttl=300)
 
 
 # ---------- helpers ----------
@@ -36,6 +46,11 @@ def _hash_password(password: str) -> str:
     return f"{salt}${h.hex()}"
 
 
+def invalidate_org_code(org_code: str | None) -> None:
+    if org_code:
+        _org_code_cache.pop(org_code)
+
+
 def _create_token(user: User) -> str:
     return create_access_token(
         data={"sub": str(user.user_id)},
@@ -98,18 +113,32 @@ class LoginResponse(BaseModel):
 @router.post("/verify-code", response_model=VerifyCodeResponse)
 def verify_code(body: VerifyCodeRequest, db: Session = Depends(get_db)):
     code = body.code.strip()
-    org = db.query(Organization).filter(Organization.org_code == code).first()
-    if not org:
-        raise HTTPException(status_code=404, detail="Company code not found")
+    cached = _org_code_cache.get(code)
+    if cached is None:
+        org = (
+            db.query(Organization.org_id, Organization.name)
+            .filter(Organization.org_code == code)
+            .first()
+        )
+        if not org:
+            raise HTTPException(status_code=404, detail="Company code not found")
+        cached = (str(org.org_id), org.name)
+        _org_code_cache.set(code, cached)
 
-    return VerifyCodeResponse(org_id=str(org.org_id), org_name=org.name)
+    return VerifyCodeResponse(org_id=cached[0], org_name=cached[1])
 
 
 @router.post("/login", response_model=LoginResponse)
 def login(body: LoginRequest, db: Session = Depends(get_db)):
     try:
         email = (body.email or "").strip().lower()
-        user = db.query(User).filter(User.email == email).first()
+        # The user's own org comes back in the same round trip.
+        user, org = (
+            db.query(User, Organization)
+            .outerjoin(Organization, Organization.org_id == User.org_id)
+            .filter(User.email == email)
+            .first()
+        ) or (None, None)
 
         if not user or not _verify_password(body.password, user.password_hash):
             raise HTTPException(status_code=401, detail="Invalid email or password")
@@ -117,20 +146,27 @@ def login(body: LoginRequest, db: Session = Depends(get_db)):
         if user.is_active is False:
             raise HTTPException(status_code=403, detail="Account disabled")
 
-        if user.org_id:
-            org = db.query(Organization).filter(Organization.org_id == user.org_id).first()
-            if org and getattr(org, "is_active", True) is False:
-                raise HTTPException(status_code=403, detail="Organization is deactivated")
+        if org and getattr(org, "is_active", True) is False:
+            raise HTTPException(status_code=403, detail="Organization is deactivated")
 
         if body.org_code:
             org_code = body.org_code.strip()
-            org = db.query(Organization).filter(Organization.org_code == org_code).first()
-            if not org:
-                raise HTTPException(status_code=404, detail="Company code not found")
-
-            if str(user.org_id) != str(org.org_id):
+            if not org or org.org_code != org_code:
+                # Only a mismatch needs the lookup, to tell a bad code from a wrong org.
+                exists = db.query(Organization.org_id).filter(Organization.org_code == org_code).first()
+                if not exists:
+                    raise HTTPException(status_code=404, detail="Company code not found")
                 raise HTTPException(status_code=403, detail="You do not belong to this organization")
 
+        if needs_rehash(user.password_hash):
+            # Upgrade legacy PBKDF2/SHA256 hashes so later logins take the bcrypt path.
+            try:
+                user.password_hash = get_password_hash(body.password)
+                db.commit()
+            except SQLAlchemyError:
+                db.rollback()
+                logger.exception("Failed to upgrade legacy password hash for user_id=%s", user.user_id)
+
         token = _create_token(user)
 
         return LoginResponse(
@@ -195,8 +231,10 @@ def me(
     if not authorization:
         raise HTTPException(status_code=401, detail="Not authenticated")
 
-    token = authorization.removeprefix("Bearer ").strip()
-    payload = verify_token(token)
+    match = _BEARER_RE.match(authorization)
+    if not match:
+        raise HTTPException(status_code=401, detail="Invalid or expired token")
+    payload = verify_token(match.group(1))
 
     user = db.query(User).filter(User.user_id == payload["user_id"]).first()
     if not user:
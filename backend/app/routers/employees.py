@@ -1,5 +1,6 @@
 # backend/app/routers/employees.py
 
+import asyncio
 import csv
 import io
 import json
@@ -486,7 +487,13 @@ async def batch_upload_employees(
     Returns summary of created, skipped, and errored rows.
     """
     content = await file.read()
-    filename = (file.filename or "").lower()
+    # Parsing, the AI header mapping and a bcrypt hash per created row all
+    # block, so run them on a worker thread instead of the event loop.
+    return await asyncio.to_thread(_import_employee_file, db, org_id, file.filename, content)
+
+
+def _import_employee_file(db: Session, org_id: uuid.UUID, filename: str | None, content: bytes) -> dict:
+    filename = (filename or "").lower()
 
     try:
         if filename.endswith(".xlsx") or filename.endswith(".xls"):
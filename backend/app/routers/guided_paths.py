@@ -14,7 +14,9 @@ from app.schemas.guided_paths import (
     ModuleCreate, ModuleUpdate, ModuleResponse, ModuleDetailResponse,
     ModuleStepResponse, SessionStepResponse, AdvanceStepRequest,
     StartSessionRequest, OutcomeRequest, ModuleSuggestion, ModuleSuggestionsResponse,
+    MODULE_SUGGESTIONS,
 )
+from app.schemas.base import dump_response
 from app.services.guided_paths import (
     list_modules, get_module, create_module, update_module, deactivate_module,
     start_session, get_session, get_module_step, advance_step, record_outcome,
@@ -39,6 +41,8 @@ def get_modules(
     org_id: UUID = Depends(get_current_org_id),
     db: Session = Depends(get_db),
 ):
+    # Validated on purpose: org_id/created_by are legacy INTEGER columns typed
+    # as UUID in ModuleResponse, so rows are not safe to model_construct.
     return list_modules(db, org_id, active_only=active_only)
 
 
@@ -82,9 +86,12 @@ def suggest(
     db: Session = Depends(get_db),
 ):
     results = suggest_modules(db, org_id, theme=theme, stress_band=stress_band, available_time=available_time)
-    return ModuleSuggestionsResponse(
-        suggestions=[ModuleSuggestion(**r) for r in results],
-        theme=theme,
+    return dump_response(
+        MODULE_SUGGESTIONS,
+        ModuleSuggestionsResponse.model_construct(
+            suggestions=[ModuleSuggestion.model_construct(**r) for r in results],
+            theme=theme,
+        ),
     )
 
 
@@ -365,10 +372,10 @@ def get_current_step(
     session_id: int,
     db: Session = Depends(get_db),
 ):
-    session = get_session(db, session_id)
+    session = get_session(db, session_id, with_module=True)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
-    module = get_module(db, session.module_id)
+    module = session.module
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
     if session.status == "completed":
@@ -392,16 +399,16 @@ def advance_session_step(
     payload: AdvanceStepRequest,
     db: Session = Depends(get_db),
 ):
-    session = get_session(db, session_id)
+    session = get_session(db, session_id, with_module=True)
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
     if session.status == "completed":
         raise HTTPException(status_code=400, detail="Session already completed")
-    module = get_module(db, session.module_id)
+    module = session.module
     if not module:
         raise HTTPException(status_code=404, detail="Module not found")
 
-    result = advance_step(db, session, module, payload.response)
+    result = advance_step(db, session, module, payload.get("response"))
     if result["completed"]:
         # ── Sprint 5: notify employee of completion ───────────────────
         try:
@@ -434,5 +441,5 @@ def record_session_outcome(
     if not session:
         raise HTTPException(status_code=404, detail="Session not found")
 
-    session = record_outcome(db, session, payload.pre_rating, payload.post_rating)
+    session = record_outcome(db, session, payload.get("pre_rating"), payload.get("post_rating"))
     return {"ok": True, "pre_rating": session.pre_rating, "post_rating": session.post_rating}
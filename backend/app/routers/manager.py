@@ -29,7 +29,10 @@ from app.schemas.manager import (
     ToolkitModuleCreate, ToolkitModuleUpdate, ToolkitModuleResponse,
     ToolkitGenerateRequest, ToolkitGeneratedItem,
     ManagerDashboardData,
+    COACHING_SESSION_LIST,
+    TEAM_MEMBER_LIST,
 )
+from app.schemas.base import construct_from_orm, dump_response
 from app.services.manager_scope import (
     get_manager_config, validate_employee_access, can_use_feature,
 )
@@ -38,7 +41,7 @@ from app.services.toolkit_service import (
 )
 from app.services.toolkit_ai import generate_toolkit_with_ai
 from app.services.manager_ai import generate_coaching_plan
-from app.services.audit import log_action
+from app.services.audit import MANAGER_AUDIT_RESOURCE_TYPES, log_action
 
 logger = logging.getLogger(__name__)
 
@@ -154,7 +157,7 @@ def get_team(
 
     team = []
     for u in direct_reports:
-        team.append(TeamMemberResponse(
+        team.append(TeamMemberResponse.model_construct(
             user_id=u.user_id,
             name=u.name or u.email or f"Employee #{u.user_id}",
             email=u.email,
@@ -165,7 +168,7 @@ def get_team(
         ))
 
     log_action(db, org_id, user_id, "view", "manager_team", details={"team_size": len(team)})
-    return team
+    return dump_response(TEAM_MEMBER_LIST, team)
 
 
 @router.get("/team/{member_id}/profile", response_model=TeamMemberResponse)
@@ -306,15 +309,15 @@ def update_coaching_outcome(
     if not session:
         raise HTTPException(status_code=404, detail="Coaching session not found")
 
-    if data.outcome not in ("improved", "same", "worse"):
+    if data["outcome"] not in ("improved", "same", "worse"):
         raise HTTPException(status_code=400, detail="Outcome must be: improved, same, or worse")
 
-    session.outcome_logged = data.outcome
+    session.outcome_logged = data["outcome"]
     db.commit()
 
     log_action(db, org_id, user_id, "update_outcome", "coaching_session", session_id,
-               details={"outcome": data.outcome})
-    return {"ok": True, "session_id": session_id, "outcome": data.outcome}
+               details={"outcome": data["outcome"]})
+    return {"ok": True, "session_id": session_id, "outcome": data["outcome"]}
 
 
 @router.get("/coaching/history", response_model=list[CoachingSessionResponse])
@@ -335,7 +338,9 @@ def get_coaching_history(
         .limit(50)
         .all()
     )
-    return sessions
+    return dump_response(
+        COACHING_SESSION_LIST, [construct_from_orm(CoachingSessionResponse, s) for s in sessions]
+    )
 
 
 # --- Toolkit ---
@@ -746,10 +751,7 @@ def get_manager_audit_trail(
         db.query(AuditLog)
         .filter(
             AuditLog.org_id == org_id,
-            AuditLog.resource_type.in_([
-                "manager_team", "employee_profile", "employee_evaluations",
-                "coaching_session", "manager_config", "toolkit_module",
-            ]),
+            AuditLog.resource_type.in_(MANAGER_AUDIT_RESOURCE_TYPES),
         )
         .order_by(AuditLog.created_at.desc())
         .limit(limit)
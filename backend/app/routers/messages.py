@@ -29,7 +29,12 @@ from app.schemas.messages import (
     DirectMessageResponse,
     ConversationResponse,
     ColleagueResponse,
+    WALL_MESSAGE_LIST,
+    CONVERSATION_LIST,
+    DIRECT_MESSAGE_LIST,
+    COLLEAGUE_LIST,
 )
+from app.schemas.base import construct_from_orm, dump_response
 
 router = APIRouter(prefix="/api/v1/messages", tags=["Messaging"])
 
@@ -129,8 +134,8 @@ def _resolve_display_name(db: Session, convo: DmConversation, user_id: uuid.UUID
     return joined
 
 
-def _build_convo_response(db: Session, convo: DmConversation, user_id: uuid.UUID) -> dict:
-    """Build a ConversationResponse dict for a conversation."""
+def _build_convo_response(db: Session, convo: DmConversation, user_id: uuid.UUID) -> ConversationResponse:
+    """Build a ConversationResponse for a conversation."""
     last_msg = (
         db.query(DmMessage)
         .filter(DmMessage.conversation_id == convo.id)
@@ -148,23 +153,26 @@ def _build_convo_response(db: Session, convo: DmConversation, user_id: uuid.UUID
         .scalar()
     )
 
-    participants = []
+    participant_ids = []
+    participant_names = []
     for p in convo.participants:
         name = db.query(User.name).filter(User.user_id == p.user_id).scalar()
-        participants.append({"id": p.user_id, "name": name or "Unknown"})
-
-    return {
-        "id": convo.id,
-        "org_id": convo.org_id,
-        "is_group": convo.is_group,
-        "title": convo.title,
-        "display_name": _resolve_display_name(db, convo, user_id),
-        "participants": participants,
-        "last_message": last_msg.content if last_msg else None,
-        "last_message_at": last_msg.created_at if last_msg else None,
-        "unread_count": unread or 0,
-        "created_at": convo.created_at,
-    }
+        participant_ids.append(p.user_id)
+        participant_names.append(name or "Unknown")
+
+    return ConversationResponse.model_construct(
+        id=convo.id,
+        org_id=convo.org_id,
+        is_group=convo.is_group,
+        title=convo.title,
+        display_name=_resolve_display_name(db, convo, user_id),
+        participant_ids=participant_ids,
+        participant_names=participant_names,
+        last_message=last_msg.content if last_msg else None,
+        last_message_at=last_msg.created_at if last_msg else None,
+        unread_count=unread or 0,
+        created_at=convo.created_at,
+    )
 
 
 def _format_system_fallback(subject: str, body: str, payload: Optional[dict]) -> str:
@@ -202,20 +210,19 @@ def list_wall_messages(
         .all()
     )
 
-    result = []
-    for msg, author_name in rows:
-        result.append(
-            {
-                "id": msg.id,
-                "org_id": msg.org_id,
-                "user_id": msg.user_id,
-                "content": msg.content,
-                "is_pinned": msg.is_pinned,
-                "author_name": author_name or "Unknown",
-                "created_at": msg.created_at,
-            }
+    result = [
+        WallMessageResponse.model_construct(
+            id=msg.id,
+            org_id=msg.org_id,
+            user_id=msg.user_id,
+            content=msg.content,
+            is_pinned=msg.is_pinned,
+            author_name=author_name or "Unknown",
+            created_at=msg.created_at,
         )
-    return result
+        for msg, author_name in rows
+    ]
+    return dump_response(WALL_MESSAGE_LIST, result)
 
 
 @router.post("/wall", response_model=WallMessageResponse)
@@ -225,7 +232,7 @@ def post_wall_message(
     org_id: uuid.UUID = Depends(get_current_org_id),
     db: Session = Depends(get_db),
 ):
-    msg = WallMessage(org_id=org_id, user_id=user_id, content=body.content)
+    msg = WallMessage(org_id=org_id, user_id=user_id, content=body["content"])
     db.add(msg)
     db.commit()
     db.refresh(msg)
@@ -275,7 +282,10 @@ def list_colleagues(
         .order_by(User.name)
         .all()
     )
-    return [{"id": u.user_id, "name": u.name, "email": u.email} for u in users]
+    return dump_response(
+        COLLEAGUE_LIST,
+        [ColleagueResponse.model_construct(id=u.user_id, name=u.name, email=u.email) for u in users],
+    )
 
 
 # ─────────────────────────────────────────────────────────────
@@ -302,8 +312,8 @@ def list_conversations(
     )
 
     result = [_build_convo_response(db, c, user_id) for c in convos]
-    result.sort(key=lambda x: x["last_message_at"] or x["created_at"], reverse=True)
-    return result
+    result.sort(key=lambda x: x.last_message_at or x.created_at, reverse=True)
+    return dump_response(CONVERSATION_LIST, result)
 
 
 @router.get("/unread-count")
@@ -399,12 +409,13 @@ def get_messages(
     if not _is_participant(db, conversation_id, user_id):
         raise HTTPException(403, "Not a participant")
 
-    return (
+    rows = (
         db.query(DmMessage)
         .filter(DmMessage.conversation_id == conversation_id)
         .order_by(DmMessage.created_at)
         .all()
     )
+    return dump_response(DIRECT_MESSAGE_LIST, [construct_from_orm(DirectMessageResponse, m) for m in rows])
 
 
 @router.post("/conversations/{conversation_id}/messages", response_model=DirectMessageResponse)
@@ -420,7 +431,7 @@ def send_message(
     if not _is_participant(db, conversation_id, user_id):
         raise HTTPException(403, "Not a participant")
 
-    msg = DmMessage(conversation_id=conversation_id, sender_id=user_id, content=body.content)
+    msg = DmMessage(conversation_id=conversation_id, sender_id=user_id, content=body["content"])
     db.add(msg)
     db.commit()
     db.refresh(msg)
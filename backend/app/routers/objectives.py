@@ -20,11 +20,22 @@ from app.schemas.objectives import (
     ObjectiveCreate, ObjectiveUpdate, ObjectiveResponse,
     KeyResultCreate, KeyResultUpdate, KeyResultResponse,
     SubmitForReviewRequest, ReviewRequest, CommentCreate, CommentResponse,
+    OBJECTIVE_LIST,
 )
+from app.schemas.base import construct_from_orm, dump_response
 
 router = APIRouter(prefix="/api/v1/objectives", tags=["Objectives"])
 
 
+def _objective_list_response(objectives: list[Objective]):
+    items = []
+    for obj in objectives:
+        item = construct_from_orm(ObjectiveResponse, obj)
+        item.key_results = [construct_from_orm(KeyResultResponse, kr) for kr in obj.key_results]
+        items.append(item)
+    return dump_response(OBJECTIVE_LIST, items)
+
+
 # ── Calendar sync helpers ──
 
 def _remove_objective_from_calendar(db: Session, org_id: uuid.UUID, objective_id: uuid.UUID) -> None:
@@ -202,14 +213,7 @@ def create_objective(
     db.flush()
 
     for kr_data in body.key_results:
-        kr = KeyResult(
-            objective_id=obj.id,
-            title=kr_data.title,
-            target_value=kr_data.target_value,
-            current_value=kr_data.current_value,
-            unit=kr_data.unit,
-        )
-        db.add(kr)
+        db.add(KeyResult(objective_id=obj.id, **kr_data))
 
     db.commit()
     db.refresh(obj)
@@ -227,7 +231,7 @@ def list_objectives(
     q = db.query(Objective).filter(Objective.user_id == user_id)
     if status:
         q = q.filter(Objective.status == status)
-    return q.order_by(Objective.created_at.desc()).all()
+    return _objective_list_response(q.order_by(Objective.created_at.desc()).all())
 
 
 @router.get("/reviewers")
@@ -322,13 +326,7 @@ def add_key_result(
     obj = db.query(Objective).filter(Objective.id == objective_id, Objective.user_id == user_id).first()
     if not obj:
         raise HTTPException(404, "Objective not found or not owned by you")
-    kr = KeyResult(
-        objective_id=objective_id,
-        title=body.title,
-        target_value=body.target_value,
-        current_value=body.current_value,
-        unit=body.unit,
-    )
+    kr = KeyResult(objective_id=objective_id, **body)
     db.add(kr)
     db.commit()
     db.refresh(kr)
@@ -431,12 +429,13 @@ def list_pending_reviews(
     _role: str = Depends(require_manager),
     db: Session = Depends(get_db),
 ):
-    return (
+    rows = (
         db.query(Objective)
         .filter(Objective.org_id == org_id, Objective.status == "pending_review")
         .order_by(Objective.updated_at.desc())
         .all()
     )
+    return _objective_list_response(rows)
 
 
 @router.post("/{objective_id}/review", response_model=ObjectiveResponse)
@@ -514,7 +513,7 @@ def add_comment(
     comment = ObjectiveComment(
         objective_id=objective_id,
         user_id=user_id,
-        content=body.content.strip(),
+        content=body["content"].strip(),
     )
     db.add(comment)
     db.commit()
@@ -34,7 +34,10 @@ from app.schemas.payroll import (
     PayrollBatchResponse,
     PayslipResponse,
     RunAdjustmentUpsertBody,
+    PAYROLL_BATCH_LIST,
+    PAYSLIP_LIST,
 )
+from app.schemas.base import construct_from_orm, dump_response
 from app.services.file_storage import save_upload, save_bytes, get_download_url, delete_file
 from app.services.audit import log_action
 from app.services.payroll_parser import parse_payroll_file
@@ -1214,12 +1217,13 @@ def list_batches(
     org_id: uuid.UUID = Depends(get_current_org_id),
     _user: User = Depends(require_payroll_access),
 ):
-    return (
+    batches = (
         db.query(PayrollBatch)
         .filter(PayrollBatch.org_id == org_id)
         .order_by(PayrollBatch.created_at.desc())
         .all()
     )
+    return dump_response(PAYROLL_BATCH_LIST, [construct_from_orm(PayrollBatchResponse, b) for b in batches])
 
 
 @router.get("/batches/{batch_id}", response_model=PayrollBatchResponse)
@@ -1965,12 +1969,14 @@ def list_my_payslips(
     org_id: uuid.UUID = Depends(get_current_org_id),
     current_user_id: uuid.UUID = Depends(get_current_user_id),
 ):
-    return (
+    payslips = (
         db.query(Payslip)
         .filter(Payslip.employee_user_id == current_user_id, Payslip.org_id == org_id)
         .order_by(Payslip.created_at.desc())
         .all()
     )
+    # Numeric columns arrive as Decimal; the float serializer emits them as JSON numbers.
+    return dump_response(PAYSLIP_LIST, [construct_from_orm(PayslipResponse, p) for p in payslips])
 
 
 @router.get("/my-payslips/{payslip_id}/download")
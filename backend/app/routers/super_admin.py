@@ -21,7 +21,7 @@ from app.dependencies import require_super_admin, get_current_user_id
 from app.models.user import Organization, User
 from app.models.document import Document
 from app.models.billing import Invoice, InvoiceLineItem, Payment
-from app.routers.auth import _hash_password
+from app.routers.auth import _hash_password, invalidate_org_code
 from app.services.email import send_hr_admin_welcome_email
 from app.services.file_storage import save_upload, get_download_url
 
@@ -393,10 +393,12 @@ def update_org(
         if existing:
             raise HTTPException(status_code=409, detail="Organization code already in use")
 
+    old_code = org.org_code
     for key, value in updates.items():
         setattr(org, key, value)
 
     db.commit()
+    invalidate_org_code(old_code)
     db.refresh(org)
     return org
 
@@ -472,8 +474,10 @@ def delete_org(
             detail="Cannot delete org with existing users/documents. Deactivate instead.",
         )
 
+    org_code = org.org_code
     db.delete(org)
     db.commit()
+    invalidate_org_code(org_code)
     return None
 
 
@@ -1,9 +1,12 @@
 """Timesheets router — Sprint 1 update."""
 
+import logging
 import uuid
 from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
-from sqlalchemy import func as sa_func, text
+from sqlalchemy import any_, bindparam, func as sa_func, insert, select, text, tuple_, update
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
 from datetime import date, datetime, timedelta
 from typing import Optional
 from decimal import Decimal
@@ -12,16 +15,39 @@ from app.database import get_db
 from app.dependencies import get_current_user_id, get_current_org_id, get_current_role, require_manager
 from app.models.timesheet import TimesheetEntry
 from app.models.user import User
+from app.services.cache import TTLCache
+from app.schemas.base import construct_from_orm, dump_response
 from app.schemas.timesheet import (
     TimesheetEntryCreate,
     TimesheetEntryUpdate,
     TimesheetEntryResponse,
+    TimesheetTeamPage,
     TimesheetSubmit,
     TimesheetApproval,
+    TIMESHEET_ENTRY_LIST,
+    TIMESHEET_TEAM_PAGE,
 )
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/v1/timesheets", tags=["Timesheets"])
 
+TIMESHEET_CATEGORIES = [
+    "Development", "Meetings", "Code Review", "Documentation", "Testing",
+    "Design", "Research", "Admin", "Training", "Support", "Other",
+]
+
+# Distinct project names per org; popped whenever an entry is written.
+# Expired lists are kept so the picker still works during a DB outage.
+_projects_cache = TTLCache(maxsize=2048, ttl=300, keep_stale=True)
+
+_EDITABLE_STATUSES = ("draft", "rejected")
+
+
+def _id_in(entry_ids):
+    """``id = ANY(:ids::uuid[])`` — one SQL text for every batch size, unlike IN (...)."""
+    return TimesheetEntry.id == any_(bindparam("entry_ids", list(entry_ids), type_=ARRAY(PG_UUID(as_uuid=True))))
+
 
 # ── CRUD ──────────────────────────────────────────────────────────────────────
 
@@ -33,7 +59,9 @@ def create_entry(
     org_id: uuid.UUID = Depends(get_current_org_id),
     db: Session = Depends(get_db),
 ):
-    entry = TimesheetEntry(
+    # INSERT ... RETURNING brings server defaults back in the same round-trip,
+    # so there is no follow-up SELECT from db.refresh().
+    stmt = insert(TimesheetEntry).values(
         org_id=org_id,
         user_id=user_id,
         date=body.date,
@@ -43,11 +71,13 @@ def create_entry(
         hours=body.hours,
         description=body.description,
         objective_id=body.objective_id,
-    )
-    db.add(entry)
+    ).returning(TimesheetEntry)
+    entry = db.scalars(stmt).one()
+    # Serialize before commit: expire_on_commit would otherwise reload the row.
+    result = TimesheetEntryResponse.model_validate(entry)
     db.commit()
-    db.refresh(entry)
-    return entry
+    _projects_cache.pop(org_id)
+    return result
 
 
 @router.get("/", response_model=list[TimesheetEntryResponse])
@@ -69,7 +99,8 @@ def list_entries(
         q = q.filter(TimesheetEntry.date <= end)
     if status:
         q = q.filter(TimesheetEntry.status == status)
-    return q.order_by(TimesheetEntry.date.desc()).all()
+    rows = q.order_by(TimesheetEntry.date.desc()).all()
+    return dump_response(TIMESHEET_ENTRY_LIST, [construct_from_orm(TimesheetEntryResponse, e) for e in rows])
 
 
 # ── Submit / Approve (bulk) ────────────────────────────────────────────────────
@@ -82,18 +113,20 @@ def submit_entries(
     org_id: uuid.UUID = Depends(get_current_org_id),
     db: Session = Depends(get_db),
 ):
-    entries = db.query(TimesheetEntry).filter(
-        TimesheetEntry.id.in_(body.entry_ids),
+    count = db.query(TimesheetEntry).filter(
+        _id_in(body.entry_ids),
         TimesheetEntry.org_id == org_id,
         TimesheetEntry.user_id == user_id,
         TimesheetEntry.status == "draft",
-    ).all()
-    now = datetime.utcnow()
-    for e in entries:
-        e.status = "submitted"
-        e.submitted_at = now
+    ).update(
+        {
+            TimesheetEntry.status: "submitted",
+            TimesheetEntry.submitted_at: sa_func.now(),
+        },
+        synchronize_session=False,
+    )
     db.commit()
-    return {"ok": True, "submitted": len(entries)}
+    return {"ok": True, "submitted": count}
 
 
 @router.post("/approve")
@@ -104,20 +137,65 @@ def approve_entries(
     role: str = Depends(require_manager),
     db: Session = Depends(get_db),
 ):
-    entries = db.query(TimesheetEntry).filter(
-        TimesheetEntry.id.in_(body.entry_ids),
-        TimesheetEntry.org_id == org_id,
-        TimesheetEntry.status == "submitted",
-    ).all()
-    now = datetime.utcnow()
     new_status = "approved" if body.action == "approve" else "rejected"
-    for e in entries:
-        e.status = new_status
-        e.approved_by = user_id
-        e.approved_at = now
-        e.approval_comment = body.comment
+    if body.items:
+        count = _approve_with_comments(db, body, new_status, user_id, org_id)
+    else:
+        count = db.query(TimesheetEntry).filter(
+            _id_in(body.entry_ids),
+            TimesheetEntry.org_id == org_id,
+            TimesheetEntry.status == "submitted",
+        ).update(
+            {
+                TimesheetEntry.status: new_status,
+                TimesheetEntry.approved_by: user_id,
+                TimesheetEntry.approved_at: sa_func.now(),
+                TimesheetEntry.approval_comment: body.comment,
+            },
+            synchronize_session=False,
+        )
     db.commit()
-    return {"ok": True, "action": body.action, "count": len(entries)}
+    return {"ok": True, "action": body.action, "count": count}
+
+
+def _approve_with_comments(
+    db: Session,
+    body: TimesheetApproval,
+    new_status: str,
+    user_id: uuid.UUID,
+    org_id: uuid.UUID,
+) -> int:
+    """Apply per-entry comments with one executemany UPDATE instead of N ORM flushes."""
+    comments = {item.entry_id: item.comment for item in body.items}
+    # executemany rowcounts are unreliable across drivers, so resolve the
+    # eligible ids first (ids only) and update exactly those.
+    eligible = [
+        r[0]
+        for r in db.query(TimesheetEntry.id).filter(
+            _id_in(list(comments)),
+            TimesheetEntry.org_id == org_id,
+            TimesheetEntry.status == "submitted",
+        ).all()
+    ]
+    if not eligible:
+        return 0
+    table = TimesheetEntry.__table__
+    stmt = (
+        update(table)
+        .where(
+            table.c.id == bindparam("b_id"),
+            table.c.org_id == org_id,
+            table.c.status == "submitted",
+        )
+        .values(
+            status=new_status,
+            approved_by=user_id,
+            approved_at=sa_func.now(),
+            approval_comment=bindparam("b_comment"),
+        )
+    )
+    db.execute(stmt, [{"b_id": eid, "b_comment": comments[eid]} for eid in eligible])
+    return len(eligible)
 
 
 # ── Admin: org-wide report ─────────────────────────────────────────────────────
@@ -496,16 +574,27 @@ def reject_single(
 # ── Team entries (manager view) ────────────────────────────────────────────────
 
 
-@router.get("/team", response_model=list[TimesheetEntryResponse])
+def _parse_team_cursor(cursor: str) -> tuple[date, uuid.UUID]:
+    try:
+        d, entry_id = cursor.split("_", 1)
+        return date.fromisoformat(d), uuid.UUID(entry_id)
+    except ValueError:
+        raise HTTPException(400, "Invalid cursor")
+
+
+@router.get("/team", response_model=TimesheetTeamPage)
 def team_entries(
     start: Optional[date] = Query(None),
     end: Optional[date] = Query(None),
     status: Optional[str] = Query(None),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    page_size: int = Query(50, ge=1, le=200),
     user_id: uuid.UUID = Depends(get_current_user_id),
     org_id: uuid.UUID = Depends(get_current_org_id),
     role: str = Depends(require_manager),
     db: Session = Depends(get_db),
 ):
+    """Keyset-paginated team entries, newest first."""
     q = db.query(TimesheetEntry).filter(TimesheetEntry.org_id == org_id)
     if start:
         q = q.filter(TimesheetEntry.date >= start)
@@ -513,7 +602,21 @@ def team_entries(
         q = q.filter(TimesheetEntry.date <= end)
     if status:
         q = q.filter(TimesheetEntry.status == status)
-    return q.order_by(TimesheetEntry.date.desc()).limit(500).all()
+    if cursor:
+        q = q.filter(tuple_(TimesheetEntry.date, TimesheetEntry.id) < _parse_team_cursor(cursor))
+
+    # Fetch one extra row to learn whether another page exists.
+    rows = q.order_by(TimesheetEntry.date.desc(), TimesheetEntry.id.desc()).limit(page_size + 1).all()
+    items = rows[:page_size]
+    next_cursor = None
+    if len(rows) > page_size:
+        last = items[-1]
+        next_cursor = f"{last.date.isoformat()}_{last.id}"
+    page = TimesheetTeamPage.model_construct(
+        items=[construct_from_orm(TimesheetEntryResponse, e) for e in items],
+        next_cursor=next_cursor,
+    )
+    return dump_response(TIMESHEET_TEAM_PAGE, page)
 
 
 # ── Summaries ──────────────────────────────────────────────────────────────────
@@ -569,17 +672,20 @@ def monthly_summary(
     start = _date(year, month, 1)
     end   = _date(year, month + 1, 1) - timedelta(days=1) if month < 12 else _date(year + 1, 1, 1) - timedelta(days=1)
 
-    entries = db.query(TimesheetEntry).filter(
+    rows = db.query(
+        TimesheetEntry.project,
+        sa_func.sum(TimesheetEntry.hours),
+        sa_func.count(TimesheetEntry.id),
+    ).filter(
         TimesheetEntry.org_id == org_id,
         TimesheetEntry.user_id == user_id,
         TimesheetEntry.date >= start,
         TimesheetEntry.date <= end,
-    ).all()
-    total      = sum(float(e.hours) for e in entries)
-    by_project = {}
-    for e in entries:
-        by_project[e.project] = by_project.get(e.project, 0) + float(e.hours)
-    return {"year": year, "month": month, "total_hours": total, "by_project": by_project, "entries": len(entries)}
+    ).group_by(TimesheetEntry.project).all()
+    by_project = {project: float(hours) for project, hours, _ in rows}
+    total      = sum(by_project.values())
+    count      = sum(n for _, _, n in rows)
+    return {"year": year, "month": month, "total_hours": total, "by_project": by_project, "entries": count}
 
 
 # ── AI feed ────────────────────────────────────────────────────────────────────
@@ -594,18 +700,27 @@ def ai_feed(
 ):
     from datetime import date as _date
     start   = _date.today() - timedelta(days=days)
-    entries = db.query(TimesheetEntry).filter(
+    rows = db.query(
+        TimesheetEntry.project,
+        TimesheetEntry.category,
+        sa_func.sum(TimesheetEntry.hours),
+        sa_func.count(TimesheetEntry.id),
+    ).filter(
         TimesheetEntry.org_id == org_id,
         TimesheetEntry.user_id == user_id,
         TimesheetEntry.date >= start,
-    ).order_by(TimesheetEntry.date).all()
+    ).group_by(TimesheetEntry.project, TimesheetEntry.category).all()
 
-    total       = sum(float(e.hours) for e in entries)
+    total       = 0.0
+    count       = 0
     by_project  = {}
     by_category = {}
-    for e in entries:
-        by_project[e.project]   = by_project.get(e.project, 0)   + float(e.hours)
-        by_category[e.category] = by_category.get(e.category, 0) + float(e.hours)
+    for project, category, hours, n in rows:
+        hours = float(hours)
+        total += hours
+        count += n
+        by_project[project]   = by_project.get(project, 0)   + hours
+        by_category[category] = by_category.get(category, 0) + hours
 
     return {
         "period_days":   days,
@@ -613,7 +728,7 @@ def ai_feed(
         "avg_daily":     round(total / max(days, 1), 1),
         "by_project":    by_project,
         "by_category":   by_category,
-        "entry_count":   len(entries),
+        "entry_count":   count,
     }
 
 
@@ -622,8 +737,7 @@ def ai_feed(
 
 @router.get("/categories")
 def list_categories():
-    return ["Development", "Meetings", "Code Review", "Documentation", "Testing",
-            "Design", "Research", "Admin", "Training", "Support", "Other"]
+    return TIMESHEET_CATEGORIES
 
 
 @router.get("/projects")
@@ -631,11 +745,25 @@ def list_projects(
     org_id: uuid.UUID = Depends(get_current_org_id),
     db: Session = Depends(get_db),
 ):
-    rows = db.query(TimesheetEntry.project).filter(
-        TimesheetEntry.org_id == org_id,
-        TimesheetEntry.activity_type == "project",   # only real projects, not org activities
-    ).distinct().all()
-    return sorted(set(r[0] for r in rows))
+    cached = _projects_cache.get(org_id)
+    if cached is not None:
+        return cached
+    try:
+        rows = db.query(TimesheetEntry.project).filter(
+            TimesheetEntry.org_id == org_id,
+            TimesheetEntry.activity_type == "project",   # only real projects, not org activities
+        ).distinct().all()
+    except SQLAlchemyError:
+        stale = _projects_cache.get_stale(org_id)
+        if stale is None:
+            raise
+        logger.warning("list_projects: database unavailable, serving stale projects for org %s", org_id)
+        return stale
+    # Deduped by Postgres, but sorted here so the order stays Python's
+    # code-point order rather than the database collation.
+    projects = sorted(r[0] for r in rows)
+    _projects_cache.set(org_id, projects)
+    return projects
 
 
 # ── Single-entry CRUD (must stay AFTER all fixed paths) ───────────────────────
@@ -658,6 +786,32 @@ def get_entry(
     return entry
 
 
+def _check_editable(db: Session, entry_id: uuid.UUID, org_id: uuid.UUID, user_id: uuid.UUID, verb: str) -> None:
+    """Existence/status guard that reads only the two columns it needs."""
+    row = db.query(TimesheetEntry.status, TimesheetEntry.is_leave).filter(
+        TimesheetEntry.id == entry_id,
+        TimesheetEntry.org_id == org_id,
+        TimesheetEntry.user_id == user_id,
+    ).first()
+    if not row:
+        raise HTTPException(404, "Entry not found")
+    if row.status not in _EDITABLE_STATUSES:
+        raise HTTPException(400, f"Can only {verb} draft or rejected entries")
+    if row.is_leave:
+        raise HTTPException(400, f"Cannot {verb} auto-generated leave entries")
+
+
+def _editable_filter(entry_id: uuid.UUID, org_id: uuid.UUID, user_id: uuid.UUID):
+    # Repeats the guard in the write itself so a concurrent submit cannot slip in.
+    return (
+        TimesheetEntry.id == entry_id,
+        TimesheetEntry.org_id == org_id,
+        TimesheetEntry.user_id == user_id,
+        TimesheetEntry.status.in_(_EDITABLE_STATUSES),
+        TimesheetEntry.is_leave.is_(False),
+    )
+
+
 @router.put("/{entry_id}", response_model=TimesheetEntryResponse)
 def update_entry(
     entry_id: uuid.UUID,
@@ -666,23 +820,27 @@ def update_entry(
     org_id: uuid.UUID = Depends(get_current_org_id),
     db: Session = Depends(get_db),
 ):
-    entry = db.query(TimesheetEntry).filter(
-        TimesheetEntry.id == entry_id,
-        TimesheetEntry.org_id == org_id,
-        TimesheetEntry.user_id == user_id,
-    ).first()
-    if not entry:
-        raise HTTPException(404, "Entry not found")
-    if entry.status not in ("draft", "rejected"):
-        raise HTTPException(400, "Can only edit draft or rejected entries")
-    if entry.is_leave:
-        raise HTTPException(400, "Cannot edit auto-generated leave entries")
-
-    for field, val in body.model_dump(exclude_unset=True).items():
-        setattr(entry, field, val)
+    _check_editable(db, entry_id, org_id, user_id, "edit")
+
+    values = body.model_dump(exclude_unset=True)
+    if values:
+        stmt = (
+            update(TimesheetEntry)
+            .where(*_editable_filter(entry_id, org_id, user_id))
+            .values(**values)
+            .returning(TimesheetEntry)
+            .execution_options(synchronize_session=False)
+        )
+    else:
+        stmt = select(TimesheetEntry).where(*_editable_filter(entry_id, org_id, user_id))
+    entry = db.scalars(stmt).one_or_none()
+    if entry is None:
+        db.rollback()
+        raise HTTPException(409, "Entry changed while editing; reload and try again")
+    result = TimesheetEntryResponse.model_validate(entry)
     db.commit()
-    db.refresh(entry)
-    return entry
+    _projects_cache.pop(org_id)
+    return result
 
 
 @router.delete("/{entry_id}")
@@ -692,17 +850,13 @@ def delete_entry(
     org_id: uuid.UUID = Depends(get_current_org_id),
     db: Session = Depends(get_db),
 ):
-    entry = db.query(TimesheetEntry).filter(
-        TimesheetEntry.id == entry_id,
-        TimesheetEntry.org_id == org_id,
-        TimesheetEntry.user_id == user_id,
-    ).first()
-    if not entry:
-        raise HTTPException(404, "Entry not found")
-    if entry.status not in ("draft", "rejected"):
-        raise HTTPException(400, "Can only delete draft or rejected entries")
-    if entry.is_leave:
-        raise HTTPException(400, "Cannot delete auto-generated leave entries")
-    db.delete(entry)
+    _check_editable(db, entry_id, org_id, user_id, "delete")
+    deleted = db.query(TimesheetEntry).filter(
+        *_editable_filter(entry_id, org_id, user_id)
+    ).delete(synchronize_session=False)
+    if not deleted:
+        db.rollback()
+        raise HTTPException(409, "Entry changed while deleting; reload and try again")
     db.commit()
+    _projects_cache.pop(org_id)
     return {"ok": True}
@@ -0,0 +1,42 @@
+"""Shared helpers for response schemas."""
+
+from typing import Any, TypeVar
+
+from fastapi import Response
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class RequestModel(BaseModel):
+    """Base for request bodies, which handlers read but never mutate."""
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ORMModel(BaseModel):
+    """Base for response schemas that are read from SQLAlchemy rows."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+def construct_from_orm(model_cls: type[ModelT], obj: Any) -> ModelT:
+    """Build a response model from a trusted ORM row without running validators.
+
+    Only for rows read straight from the database, whose column types already
+    match the schema. Use ``model_validate`` wherever coercion is needed.
+    """
+    return model_cls.model_construct(
+        **{name: getattr(obj, name, None) for name in model_cls.model_fields}
+    )
+
+
+def dump_response(adapter: TypeAdapter, data: Any) -> Response:
+    """Serialize trusted data straight to a JSON response.
+
+    FastAPI re-validates whatever a route returns against its response_model
+    (model instances are dumped to dicts first). Returning a Response skips
+    that pass; keep response_model on the decorator so the OpenAPI schema
+    still documents the shape.
+    """
+    return Response(content=adapter.dump_json(data), media_type="application/json")
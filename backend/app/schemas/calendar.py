@@ -3,6 +3,8 @@ from typing import Optional
 from datetime import datetime, date
 from uuid import UUID
 
+__all__ = ["CalendarEventCreate", "CalendarEventUpdate", "CalendarEventResponse"]
+
 
 class CalendarEventCreate(BaseModel):
     title: str
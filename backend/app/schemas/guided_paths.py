@@ -1,18 +1,44 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Annotated, Literal, Union
+from typing_extensions import NotRequired, TypedDict
 from datetime import datetime
 from uuid import UUID
 
+from app.schemas.base import ORMModel, RequestModel
 
-class ModuleStepDefinition(BaseModel):
-    type: str  # intro, prompt, input, reflection, rating, summary, video, audio
+
+class _StepBase(RequestModel):
+    type: str
     message: str
     expected_input: str | None = None  # none, free_text, rating_0_10
     safety_check: bool = False
     media_url: str | None = None  # YouTube/Vimeo URL for video, direct URL for audio
 
 
-class ModuleCreate(BaseModel):
+class TextStep(_StepBase):
+    type: Literal["intro", "prompt", "reflection", "summary"]
+
+
+class InputStep(_StepBase):
+    type: Literal["input"]
+
+
+class RatingStep(_StepBase):
+    type: Literal["rating"]
+
+
+class MediaStep(_StepBase):
+    type: Literal["video", "audio"]
+
+
+# Tagged on "type" so each step is validated against exactly one variant.
+ModuleStepDefinition = Annotated[
+    Union[TextStep, InputStep, RatingStep, MediaStep],
+    Field(discriminator="type"),
+]
+
+
+class ModuleCreate(RequestModel):
     name: str
     category: str
     description: str | None = None
@@ -23,19 +49,19 @@ class ModuleCreate(BaseModel):
     safety_checks: list[str] = []
 
 
-class ModuleUpdate(BaseModel):
-    name: Optional[str] = None
-    category: Optional[str] = None
-    description: Optional[str] = None
-    duration_minutes: Optional[int] = None
-    icon: Optional[str] = None
-    steps: Optional[list[ModuleStepDefinition]] = None
-    triggers: Optional[list[str]] = None
-    safety_checks: Optional[list[str]] = None
-    is_active: Optional[bool] = None
+class ModuleUpdate(RequestModel):
+    name: str | None = None
+    category: str | None = None
+    description: str | None = None
+    duration_minutes: int | None = None
+    icon: str | None = None
+    steps: list[ModuleStepDefinition] | None = None
+    triggers: list[str] | None = None
+    safety_checks: list[str] | None = None
+    is_active: bool | None = None
 
 
-class ModuleResponse(BaseModel):
+class ModuleResponse(ORMModel):
     id: int
     org_id: UUID | None
     name: str
@@ -45,10 +71,8 @@ class ModuleResponse(BaseModel):
     icon: str | None = None
     is_active: bool
     created_by: UUID | None = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
 
 class ModuleDetailResponse(ModuleResponse):
@@ -67,7 +91,7 @@ class ModuleStepResponse(BaseModel):
     media_url: str | None = None
 
 
-class SessionResponse(BaseModel):
+class SessionResponse(ORMModel):
     id: int
     user_id: UUID | None
     org_id: UUID | None
@@ -76,10 +100,8 @@ class SessionResponse(BaseModel):
     status: str
     pre_rating: int | None = None
     post_rating: int | None = None
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
 
 
 class SessionStepResponse(BaseModel):
@@ -89,11 +111,11 @@ class SessionStepResponse(BaseModel):
     status: str
 
 
-class AdvanceStepRequest(BaseModel):
-    response: str | None = None
+class AdvanceStepRequest(TypedDict):
+    response: NotRequired[str | None]
 
 
-class StartSessionRequest(BaseModel):
+class StartSessionRequest(RequestModel):
     role_key: str | None = None
     language: str | None = "en"
     stress_band: str | None = None  # low, moderate, high, crisis
@@ -102,9 +124,9 @@ class StartSessionRequest(BaseModel):
     pre_rating: int | None = None  # 0-10
 
 
-class OutcomeRequest(BaseModel):
-    pre_rating: int | None = None
-    post_rating: int | None = None
+class OutcomeRequest(TypedDict):
+    pre_rating: NotRequired[int | None]
+    post_rating: NotRequired[int | None]
 
 
 class ModuleSuggestion(BaseModel):
@@ -120,3 +142,6 @@ class ModuleSuggestion(BaseModel):
 class ModuleSuggestionsResponse(BaseModel):
     suggestions: list[ModuleSuggestion]
     theme: str | None = None
+
+
+MODULE_SUGGESTIONS = TypeAdapter(ModuleSuggestionsResponse)
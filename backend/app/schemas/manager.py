@@ -1,43 +1,48 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Any
+from typing_extensions import TypedDict
 from datetime import datetime
 from uuid import UUID
 
+from app.schemas.base import ORMModel, RequestModel
+
 
 # --- Manager Config ---
 
-class ManagerConfigCreate(BaseModel):
+_DEFAULT_DATA_TYPES = ("profile", "objectives", "evaluations")
+_DEFAULT_FEATURES = ("coaching_ai",)
+
+
+class ManagerConfigCreate(RequestModel):
     user_id: UUID
-    org_member_id: Optional[UUID] = None
+    org_member_id: UUID | None = None
     manager_level: str = "L1"
-    allowed_data_types: list = ["profile", "objectives", "evaluations"]
-    allowed_features: list = ["coaching_ai"]
-    department_scope: list = []
+    allowed_data_types: list[str] = Field(default_factory=lambda: list(_DEFAULT_DATA_TYPES))
+    allowed_features: list[str] = Field(default_factory=lambda: list(_DEFAULT_FEATURES))
+    department_scope: list[str] = Field(default_factory=list)
 
 
-class ManagerConfigUpdate(BaseModel):
-    org_member_id: Optional[UUID] = None
-    manager_level: Optional[str] = None
-    allowed_data_types: Optional[list] = None
-    allowed_features: Optional[list] = None
-    department_scope: Optional[list] = None
-    is_active: Optional[bool] = None
+class ManagerConfigUpdate(RequestModel):
+    org_member_id: UUID | None = None
+    manager_level: str | None = None
+    allowed_data_types: list[str] | None = None
+    allowed_features: list[str] | None = None
+    department_scope: list[str] | None = None
+    is_active: bool | None = None
 
 
-class ManagerConfigResponse(BaseModel):
+class ManagerConfigResponse(ORMModel):
     id: int
     user_id: UUID
     org_id: UUID
-    org_member_id: Optional[UUID] = None
+    org_member_id: UUID | None = None
     manager_level: str
-    allowed_data_types: list = []
-    allowed_features: list = []
-    department_scope: list = []
+    allowed_data_types: list[str] = []
+    allowed_features: list[str] = []
+    department_scope: list[str] = []
     is_active: bool
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
 
 # --- Team Member (composite view) ---
@@ -45,93 +50,89 @@ class ManagerConfigResponse(BaseModel):
 class TeamMemberResponse(BaseModel):
     user_id: UUID
     name: str
-    job_title: Optional[str] = None
-    department: Optional[str] = None
-    email: Optional[str] = None
+    job_title: str | None = None
+    department: str | None = None
+    email: str | None = None
     objectives_count: int = 0
-    last_evaluation_rating: Optional[int] = None
+    last_evaluation_rating: int | None = None
 
 
 # --- Coaching ---
 
-class CoachingRequest(BaseModel):
+class CoachingRequest(RequestModel):
     employee_member_id: UUID
     concern: str
 
 
 class CoachingResponse(BaseModel):
     session_id: int
-    employee_name: Optional[str] = None
+    employee_name: str | None = None
     situation_summary: str
     conversation_script: str
     action_options: list[str] = []
     escalation_path: str = ""
 
 
-class CoachingSessionResponse(BaseModel):
+class CoachingSessionResponse(ORMModel):
     id: int
     manager_id: UUID
     org_id: UUID
     employee_member_id: UUID
-    employee_name: Optional[str] = None
+    employee_name: str | None = None
     concern: str
-    ai_response: Optional[str] = None
-    structured_response: Optional[dict] = None
-    outcome_logged: Optional[str] = None
-    created_at: Optional[datetime] = None
+    ai_response: str | None = None
+    structured_response: dict[str, Any] | None = None
+    outcome_logged: str | None = None
+    created_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
 
-
-class CoachingOutcomeUpdate(BaseModel):
+class CoachingOutcomeUpdate(TypedDict):
     outcome: str  # improved / same / worse
 
 
 # --- Toolkit Module ---
 
-class ToolkitModuleCreate(BaseModel):
+class ToolkitModuleCreate(RequestModel):
     category: str
     title: str
-    content: dict = {}
+    content: dict[str, Any] = {}
     language: str = "en"
 
 
-class ToolkitModuleUpdate(BaseModel):
-    category: Optional[str] = None
-    title: Optional[str] = None
-    content: Optional[dict] = None
-    is_active: Optional[bool] = None
-    language: Optional[str] = None
+class ToolkitModuleUpdate(RequestModel):
+    category: str | None = None
+    title: str | None = None
+    content: dict[str, Any] | None = None
+    is_active: bool | None = None
+    language: str | None = None
 
 
-class ToolkitModuleResponse(BaseModel):
+class ToolkitModuleResponse(ORMModel):
     id: int
-    org_id: Optional[UUID] = None
+    org_id: UUID | None = None
     category: str
     title: str
-    content: dict = {}
+    content: dict[str, Any] = {}
     version: int
     is_active: bool
     language: str
-    created_by: Optional[UUID] = None
-    approved_by: Optional[str] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
+    created_by: UUID | None = None
+    approved_by: str | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
 
-class ToolkitGenerateRequest(BaseModel):
-    prompt: Optional[str] = None
-    category: Optional[str] = None
+class ToolkitGenerateRequest(RequestModel):
+    prompt: str | None = None
+    category: str | None = None
     save: bool = False
-    generated: Optional[dict] = None  # when save=True, can send pre-generated {title, category, content} to save without re-calling AI
+    generated: dict[str, Any] | None = None  # when save=True, can send pre-generated {title, category, content} to save without re-calling AI
 
 
 class ToolkitGeneratedItem(BaseModel):
     title: str
     category: str
-    content: dict = {}
+    content: dict[str, Any] = {}
 
 
 # --- Dashboard ---
@@ -140,5 +141,9 @@ class ManagerDashboardData(BaseModel):
     team_size: int = 0
     avg_performance_rating: float = 0.0
     coaching_sessions_count: int = 0
-    recent_sessions: list = []
-    timesheet_status: list = []
+    recent_sessions: list[dict[str, Any]] = []
+    timesheet_status: list[dict[str, Any]] = []
+
+
+COACHING_SESSION_LIST = TypeAdapter(list[CoachingSessionResponse])
+TEAM_MEMBER_LIST = TypeAdapter(list[TeamMemberResponse])
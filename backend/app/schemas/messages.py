@@ -1,73 +1,70 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
 from datetime import datetime
 from uuid import UUID
 
+from app.schemas.base import ORMModel, RequestModel
+
 
 # ── Wall Messages ──
 
-class WallMessageCreate(BaseModel):
+class WallMessageCreate(TypedDict):
     content: str
 
 
-class WallMessageResponse(BaseModel):
+class WallMessageResponse(ORMModel):
     id: UUID
     org_id: UUID
     user_id: UUID
     content: str
     is_pinned: bool
-    author_name: Optional[str] = None
-    created_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
+    author_name: str | None = None
+    created_at: datetime | None = None
 
 
 # ── Conversations ──
 
-class StartConversationRequest(BaseModel):
+class StartConversationRequest(RequestModel):
     recipient_ids: list[UUID]
     content: str
-    title: Optional[str] = None
+    title: str | None = None
 
 
-class DirectMessageCreate(BaseModel):
+class DirectMessageCreate(TypedDict):
     content: str
 
 
-class DirectMessageResponse(BaseModel):
+class DirectMessageResponse(ORMModel):
     id: UUID
     conversation_id: UUID
     sender_id: UUID
     content: str
-    read_at: Optional[datetime] = None
-    created_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
-
-
-class ParticipantInfo(BaseModel):
-    id: UUID
-    name: Optional[str] = None
+    read_at: datetime | None = None
+    created_at: datetime | None = None
 
 
-class ConversationResponse(BaseModel):
+class ConversationResponse(ORMModel):
     id: UUID
     org_id: UUID
     is_group: bool = False
-    title: Optional[str] = None
-    display_name: Optional[str] = None
-    participants: list[ParticipantInfo] = []
-    last_message: Optional[str] = None
-    last_message_at: Optional[datetime] = None
+    title: str | None = None
+    display_name: str | None = None
+    # Parallel arrays: participant_names[i] belongs to participant_ids[i].
+    participant_ids: list[UUID] = []
+    participant_names: list[str | None] = []
+    last_message: str | None = None
+    last_message_at: datetime | None = None
     unread_count: int = 0
-    created_at: Optional[datetime] = None
+    created_at: datetime | None = None
 
-    model_config = {"from_attributes": True}
 
-
-class ColleagueResponse(BaseModel):
+class ColleagueResponse(ORMModel):
     id: UUID
-    name: Optional[str] = None
-    email: Optional[str] = None
+    name: str | None = None
+    email: str | None = None
+
 
-    model_config = {"from_attributes": True}
+WALL_MESSAGE_LIST = TypeAdapter(list[WallMessageResponse])
+DIRECT_MESSAGE_LIST = TypeAdapter(list[DirectMessageResponse])
+COLLEAGUE_LIST = TypeAdapter(list[ColleagueResponse])
+CONVERSATION_LIST = TypeAdapter(list[ConversationResponse])
@@ -1,88 +1,88 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import TypeAdapter
+from typing_extensions import NotRequired, TypedDict
 from datetime import date, datetime
 from uuid import UUID
 
+from app.schemas.base import ORMModel, RequestModel
 
-class KeyResultCreate(BaseModel):
+
+class KeyResultCreate(TypedDict):
+    # Omitted keys fall back to the KeyResult column defaults (100, 0, "%").
     title: str
-    target_value: float = 100
-    current_value: float = 0
-    unit: str = "%"
+    target_value: NotRequired[float]
+    current_value: NotRequired[float]
+    unit: NotRequired[str]
 
 
-class KeyResultUpdate(BaseModel):
-    title: Optional[str] = None
-    target_value: Optional[float] = None
-    current_value: Optional[float] = None
-    unit: Optional[str] = None
+class KeyResultUpdate(RequestModel):
+    title: str | None = None
+    target_value: float | None = None
+    current_value: float | None = None
+    unit: str | None = None
 
 
-class KeyResultResponse(BaseModel):
+class KeyResultResponse(ORMModel):
     id: UUID
     objective_id: UUID
     title: str
     target_value: float
     current_value: float
     unit: str
-    created_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
+    created_at: datetime | None = None
 
 
-class ObjectiveCreate(BaseModel):
+class ObjectiveCreate(RequestModel):
     title: str
-    description: Optional[str] = None
-    target_date: Optional[date] = None
+    description: str | None = None
+    target_date: date | None = None
     key_results: list[KeyResultCreate] = []
 
 
-class ObjectiveUpdate(BaseModel):
-    title: Optional[str] = None
-    description: Optional[str] = None
-    target_date: Optional[date] = None
-    status: Optional[str] = None
+class ObjectiveUpdate(RequestModel):
+    title: str | None = None
+    description: str | None = None
+    target_date: date | None = None
+    status: str | None = None
 
 
-class ObjectiveResponse(BaseModel):
+class ObjectiveResponse(ORMModel):
     id: UUID
     org_id: UUID
     user_id: UUID
     title: str
-    description: Optional[str] = None
-    target_date: Optional[date] = None
+    description: str | None = None
+    target_date: date | None = None
     status: str
     progress: int
-    reviewed_by: Optional[UUID] = None
-    review_status: Optional[str] = None
-    review_notes: Optional[str] = None
-    reviewed_at: Optional[datetime] = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    reviewed_by: UUID | None = None
+    review_status: str | None = None
+    review_notes: str | None = None
+    reviewed_at: datetime | None = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
     key_results: list[KeyResultResponse] = []
 
-    model_config = {"from_attributes": True}
 
-
-class SubmitForReviewRequest(BaseModel):
+class SubmitForReviewRequest(RequestModel):
     reviewer_id: UUID
 
 
-class ReviewRequest(BaseModel):
+class ReviewRequest(RequestModel):
     review_status: str  # "approved" or "needs_revision"
-    review_notes: Optional[str] = None
+    review_notes: str | None = None
 
 
-class CommentCreate(BaseModel):
+class CommentCreate(TypedDict):
     content: str
 
 
-class CommentResponse(BaseModel):
+class CommentResponse(ORMModel):
     id: UUID
     objective_id: UUID
     user_id: UUID
-    user_name: Optional[str] = None
+    user_name: str | None = None
     content: str
-    created_at: Optional[datetime] = None
+    created_at: datetime | None = None
+
 
-    model_config = {"from_attributes": True}
+OBJECTIVE_LIST = TypeAdapter(list[ObjectiveResponse])
@@ -1,12 +1,12 @@
-from pydantic import BaseModel
-from typing import Optional
 from datetime import datetime
 from uuid import UUID
 
+from app.schemas.base import ORMModel, RequestModel
+
 
 # ─── Org Profile ─────────────────────────────────────────────────────
 
-class OrgProfileCreate(BaseModel):
+class OrgProfileCreate(RequestModel):
     org_purpose: str | None = None
     industry: str | None = None
     work_environment: str | None = None  # remote, hybrid, on-site, field-based
@@ -14,30 +14,28 @@ class OrgProfileCreate(BaseModel):
     benefits_tags: list[str] = []
 
 
-class OrgProfileUpdate(BaseModel):
-    org_purpose: Optional[str] = None
-    industry: Optional[str] = None
-    work_environment: Optional[str] = None
-    departments: Optional[list[str]] = None
-    benefits_tags: Optional[list[str]] = None
+class OrgProfileUpdate(RequestModel):
+    org_purpose: str | None = None
+    industry: str | None = None
+    work_environment: str | None = None
+    departments: list[str] | None = None
+    benefits_tags: list[str] | None = None
 
 
-class OrgProfileResponse(BaseModel):
+class OrgProfileResponse(ORMModel):
     org_id: UUID
     org_purpose: str | None = None
     industry: str | None = None
     work_environment: str | None = None
     departments: list[str] | None = None
     benefits_tags: list[str] | None = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
 
 # ─── Role Profile ────────────────────────────────────────────────────
 
-class RoleProfileCreate(BaseModel):
+class RoleProfileCreate(RequestModel):
     role_key: str
     role_family: str | None = None
     seniority_band: str | None = None  # individual_contributor, team_lead, manager
@@ -45,21 +43,19 @@ class RoleProfileCreate(BaseModel):
     stressor_profile: list[str] = []
 
 
-class RoleProfileUpdate(BaseModel):
-    role_family: Optional[str] = None
-    seniority_band: Optional[str] = None
-    work_pattern: Optional[str] = None
-    stressor_profile: Optional[list[str]] = None
+class RoleProfileUpdate(RequestModel):
+    role_family: str | None = None
+    seniority_band: str | None = None
+    work_pattern: str | None = None
+    stressor_profile: list[str] | None = None
 
 
-class RoleProfileResponse(BaseModel):
+class RoleProfileResponse(ORMModel):
     org_id: UUID
     role_key: str
     role_family: str | None = None
     seniority_band: str | None = None
     work_pattern: str | None = None
     stressor_profile: list[str] | None = None
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
-
-    model_config = {"from_attributes": True}
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
@@ -1,12 +1,11 @@
 import uuid
-from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 
+from app.schemas.base import ORMModel, RequestModel
 
-class PayrollTemplateResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class PayrollTemplateResponse(ORMModel):
     template_id: uuid.UUID
     org_id: uuid.UUID
     title: str
@@ -17,9 +16,7 @@ class PayrollTemplateResponse(BaseModel):
     created_at: datetime
 
 
-class PayrollBatchResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
-
+class PayrollBatchResponse(ORMModel):
     batch_id: uuid.UUID
     org_id: uuid.UUID
     period_year: int
@@ -28,30 +25,36 @@ class PayrollBatchResponse(BaseModel):
     upload_storage_key: str
     upload_mime_type: str
     status: str
-    payroll_total: Optional[float] = None
-    computed_total: Optional[float] = None
-    discrepancy: Optional[float] = None
+    payroll_total: float | None = None
+    computed_total: float | None = None
+    discrepancy: float | None = None
     created_by_user_id: uuid.UUID
     created_at: datetime
-    approved_by_user_id: Optional[uuid.UUID] = None
-    approved_at: Optional[datetime] = None
-    distributed_at: Optional[datetime] = None
-
+    approved_by_user_id: uuid.UUID | None = None
+    approved_at: datetime | None = None
+    distributed_at: datetime | None = None
 
-class PayslipResponse(BaseModel):
-    model_config = ConfigDict(from_attributes=True)
 
+class PayslipResponse(ORMModel):
     payslip_id: uuid.UUID
     org_id: uuid.UUID
     batch_id: uuid.UUID
     employee_user_id: uuid.UUID
-    gross_pay: Optional[float] = None
-    total_deductions: Optional[float] = None
-    net_pay: Optional[float] = None
+    gross_pay: float | None = None
+    total_deductions: float | None = None
+    net_pay: float | None = None
     document_id: uuid.UUID
     created_at: datetime
 
 
+class PayslipEntry(BaseModel):
+    employee_name: str
+    gross_salary: float
+    deductions: float
+    net_salary: float
+    matched_user_id: str | None = None
+
+
 class PayrollSummary(BaseModel):
     batch_id: str
     period_year: int
@@ -63,29 +66,25 @@ class PayrollSummary(BaseModel):
     matched_count: int
     unmatched_names: list[str] = []
     reconciled: bool
-    entries: list[dict] = []
+    entries: list[PayslipEntry] = []
 
 
-class PayslipEntry(BaseModel):
-    employee_name: str
-    gross_salary: float
-    deductions: float
-    net_salary: float
-    matched_user_id: Optional[str] = None
-
-
-class RunAdjustmentPayload(BaseModel):
+class RunAdjustmentPayload(RequestModel):
     """Per-employee pay adjustments for a payroll run (bonuses, deductions, pension, loans)."""
     user_id: uuid.UUID
-    base_salary_override: Optional[float] = None
+    base_salary_override: float | None = None
     bonus: float = 0.0
     pension_optional: float = 0.0
     insurance_relief_basis: float = 0.0
     loan_repayment: float = 0.0
     other_deductions: float = 0.0
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
-class RunAdjustmentUpsertBody(BaseModel):
+class RunAdjustmentUpsertBody(RequestModel):
     month: str  # YYYY-MM
     adjustments: list[RunAdjustmentPayload]
+
+
+PAYROLL_BATCH_LIST = TypeAdapter(list[PayrollBatchResponse])
+PAYSLIP_LIST = TypeAdapter(list[PayslipResponse])
@@ -1,29 +1,31 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, TypeAdapter
+import datetime as _dt
 from datetime import date, datetime
 from uuid import UUID
 from decimal import Decimal
 
+from app.schemas.base import ORMModel, RequestModel
 
-class TimesheetEntryCreate(BaseModel):
+
+class TimesheetEntryCreate(RequestModel):
     date: date
     project: str
     category: str = "Development"
     hours: Decimal = Field(gt=0, le=24)
     description: str = ""
-    objective_id: Optional[UUID] = None
+    objective_id: UUID | None = None
 
 
-class TimesheetEntryUpdate(BaseModel):
-    date: Optional[date] = None
-    project: Optional[str] = None
-    category: Optional[str] = None
-    hours: Optional[Decimal] = Field(default=None, gt=0, le=24)
-    description: Optional[str] = None
-    objective_id: Optional[UUID] = None
+class TimesheetEntryUpdate(RequestModel):
+    date: _dt.date | None = None  # plain `date` here would resolve to the None default
+    project: str | None = None
+    category: str | None = None
+    hours: Decimal | None = Field(default=None, gt=0, le=24)
+    description: str | None = None
+    objective_id: UUID | None = None
 
 
-class TimesheetEntryResponse(BaseModel):
+class TimesheetEntryResponse(ORMModel):
     id: UUID
     org_id: UUID
     user_id: UUID
@@ -32,23 +34,37 @@ class TimesheetEntryResponse(BaseModel):
     category: str
     hours: Decimal
     description: str
-    objective_id: Optional[UUID] = None
+    objective_id: UUID | None = None
     status: str
-    submitted_at: Optional[datetime] = None
-    approved_by: Optional[UUID] = None
-    approved_at: Optional[datetime] = None
+    submitted_at: datetime | None = None
+    approved_by: UUID | None = None
+    approved_at: datetime | None = None
     approval_comment: str
-    created_at: Optional[datetime] = None
-    updated_at: Optional[datetime] = None
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
 
-    model_config = {"from_attributes": True}
+class TimesheetTeamPage(BaseModel):
+    items: list[TimesheetEntryResponse]
+    next_cursor: str | None = None  # "<date>_<entry id>" of the last item, if more remain
 
 
-class TimesheetSubmit(BaseModel):
+class TimesheetSubmit(RequestModel):
     entry_ids: list[UUID]
 
 
-class TimesheetApproval(BaseModel):
-    entry_ids: list[UUID]
+class TimesheetApprovalItem(RequestModel):
+    entry_id: UUID
+    comment: str = ""
+
+
+class TimesheetApproval(RequestModel):
+    entry_ids: list[UUID] = []
     action: str = "approve"  # "approve" or "reject"
     comment: str = ""
+    # Per-entry comments; when given, these entries are processed instead of entry_ids.
+    items: list[TimesheetApprovalItem] = []
+
+
+TIMESHEET_ENTRY_LIST = TypeAdapter(list[TimesheetEntryResponse])
+TIMESHEET_TEAM_PAGE = TypeAdapter(TimesheetTeamPage)
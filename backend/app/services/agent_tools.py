@@ -1262,11 +1262,11 @@ def _search_knowledge_base(args: dict, user_id: UUID, org_id: UUID, db: Session)
                         FROM document_chunks dc
                         WHERE dc.document_id = d.id
                           AND (
-                              to_tsvector('english', dc.content) @@ to_tsquery('english', :orq)
+                              dc.content_tsv @@ to_tsquery('english', :orq)
                               OR dc.content ILIKE :ql
                           )
                         ORDER BY
-                            ts_rank(to_tsvector('english', dc.content), to_tsquery('english', :orq)) DESC,
+                            ts_rank(dc.content_tsv, to_tsquery('english', :orq)) DESC,
                             dc.chunk_index
                         LIMIT 1
                     ) AS matching_chunk
@@ -1283,7 +1283,7 @@ def _search_knowledge_base(args: dict, user_id: UUID, org_id: UUID, db: Session)
                           SELECT 1 FROM document_chunks dc2
                           WHERE dc2.document_id = d.id
                             AND (
-                                to_tsvector('english', dc2.content) @@ to_tsquery('english', :orq)
+                                dc2.content_tsv @@ to_tsquery('english', :orq)
                                 OR dc2.content ILIKE :ql
                             )
                       )
@@ -1,30 +1,165 @@
+import atexit
+import logging
+import os
+import threading
 import uuid
-from typing import Any, Optional, Union
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, Union
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm import Session
+
 from app.models.audit_log import AuditLog
 
+logger = logging.getLogger(__name__)
+
+# Audit rows are written in batches by a background thread. A crash can lose up
+# to one flush interval of entries; that is the accepted trade for taking the
+# audit commit off every request.
+AUDIT_TRAIL_BUFFER_MAX_SIZE = int(os.getenv("AUDIT_TRAIL_BUFFER_MAX_SIZE", "500"))
+AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL = float(os.getenv("AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL", "30"))
+# Hard cap while the database is unreachable; beyond it the oldest rows are dropped.
+AUDIT_TRAIL_BUFFER_MAX_BACKLOG = int(os.getenv("AUDIT_TRAIL_BUFFER_MAX_BACKLOG", "10000"))
+
+# Rows the app itself reads back right after writing them bypass the buffer
+# and are committed in the caller's session: the manager audit trail, and the
+# payroll approval trail's "distributed by".
+MANAGER_AUDIT_RESOURCE_TYPES = (
+    "manager_team", "employee_profile", "employee_evaluations",
+    "coaching_session", "manager_config", "toolkit_module",
+)
+_IMMEDIATE_ACTIONS = frozenset({("payroll_batch", "distribute")})
+
+
+def _written_immediately(action: str, resource_type: str) -> bool:
+    return resource_type in MANAGER_AUDIT_RESOURCE_TYPES or (resource_type, action) in _IMMEDIATE_ACTIONS
 
-def _to_uuid(value: Any) -> Optional[uuid.UUID]:
+
+def _to_uuid(value: Any, _UUID=uuid.UUID) -> Optional[uuid.UUID]:
     """Convert value to uuid.UUID, or return None."""
-    if value is None:
-        return None
-    if isinstance(value, uuid.UUID):
+    # Callers almost always pass a UUID straight from a dependency or ORM row.
+    if value is None or value.__class__ is _UUID:
         return value
     try:
-        return uuid.UUID(str(value))
-    except (ValueError, AttributeError):
+        if isinstance(value, str):
+            return _UUID(value)
+        if isinstance(value, _UUID):
+            return value
+        return _UUID(str(value))
+    except (ValueError, AttributeError, TypeError):
         return None
 
 
 def _serialize_details(details: Any) -> Any:
-    """Recursively convert UUID/non-JSON-serializable values to strings."""
-    if isinstance(details, dict):
-        return {k: _serialize_details(v) for k, v in details.items()}
-    if isinstance(details, (list, tuple)):
-        return [_serialize_details(v) for v in details]
-    if isinstance(details, uuid.UUID):
-        return str(details)
-    return details
+    """Make details JSON-safe: UUIDs/datetimes become strings, other unknowns str()."""
+    if details is None:
+        return None
+    return orjson.loads(orjson.dumps(details, default=str, option=orjson.OPT_NON_STR_KEYS))
+
+
+class AuditBuffer:
+    """Collects audit_log row dicts and writes them in one transaction per batch.
+
+    A daemon thread flushes every ``flush_interval`` seconds, or as soon as
+    ``max_size`` rows are waiting. ``flush`` can also be called directly and
+    runs at interpreter exit. A batch that fails because the database is
+    unreachable is put back for the next flush. At most ``max_backlog`` rows
+    are held; past that the oldest are dropped and counted in ``dropped``.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_size: int = AUDIT_TRAIL_BUFFER_MAX_SIZE,
+        flush_interval: float = AUDIT_TRAIL_BUFFER_FLUSH_INTERVAL,
+        max_backlog: int = AUDIT_TRAIL_BUFFER_MAX_BACKLOG,
+    ):
+        self.session_factory = session_factory
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+        self._rows: deque = deque(maxlen=max_backlog)
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def add(self, row: dict[str, Any]) -> None:
+        with self._lock:
+            if len(self._rows) == self._rows.maxlen:
+                self._count_dropped(1)
+            self._rows.append(row)
+            full = len(self._rows) >= self.max_size
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="audit-flush", daemon=True)
+                self._thread.start()
+        if full:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Write everything buffered so far; returns the number of rows written."""
+        with self._lock:
+            batch = list(self._rows)
+            self._rows.clear()
+        if not batch:
+            return 0
+        db = self.session_factory()
+        try:
+            # Audit rows are not worth a WAL fsync of their own; let Postgres
+            # acknowledge this commit before the flush reaches disk.
+            db.execute(text("SET LOCAL synchronous_commit = off"))
+            # executemany over the plain table: no ORM instances or identity map
+            # for rows nobody reads back.
+            db.execute(AuditLog.__table__.insert(), batch)
+            db.commit()
+            return len(batch)
+        except OperationalError:
+            db.rollback()
+            logger.warning("Database unavailable; keeping %d audit log entries for retry", len(batch))
+            self._requeue(batch)
+            return 0
+        except SQLAlchemyError:
+            db.rollback()
+            logger.exception("Failed to write %d audit log entries", len(batch))
+            return 0
+        finally:
+            db.close()
+
+    def _requeue(self, batch: list) -> None:
+        with self._lock:
+            rows = batch + list(self._rows)
+            self._rows.clear()
+            # The bounded deque keeps the newest rows.
+            self._rows.extend(rows)
+            if len(rows) > self._rows.maxlen:
+                self._count_dropped(len(rows) - self._rows.maxlen)
+
+    def _count_dropped(self, n: int) -> None:
+        before = self.dropped
+        self.dropped += n
+        if before == 0 or before // 1000 != self.dropped // 1000:
+            logger.warning("Audit buffer full; %d entries dropped so far", self.dropped)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+
+def _session_factory() -> Session:
+    from app.database import SessionLocal
+
+    return SessionLocal()
+
+
+_buffer = AuditBuffer(_session_factory)
+atexit.register(_buffer.flush)
 
 
 def log_action(
@@ -37,7 +172,7 @@ def log_action(
     details: dict | None = None,
     ip_address: str | None = None,
 ):
-    entry = AuditLog(
+    entry = dict(
         org_id=_to_uuid(org_id),
         user_id=_to_uuid(user_id),
         action=action,
@@ -45,7 +180,13 @@ def log_action(
         resource_id=str(resource_id) if resource_id is not None else None,
         details=_serialize_details(details),
         ip_address=ip_address,
+        # Stamp now: the row is inserted up to a flush interval later.
+        created_at=datetime.now(timezone.utc),
     )
-    db.add(entry)
-    db.commit()
+    if _written_immediately(action, resource_type):
+        db.execute(AuditLog.__table__.insert(), [entry])
+        db.commit()
+        return entry
+    # Written later by the background flusher, outside the caller's transaction.
+    _buffer.add(entry)
     return entry
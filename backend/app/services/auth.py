@@ -1,12 +1,15 @@
 import hashlib
+import hmac
 import secrets
 import os
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
-from jose import JWTError, jwt
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from app.config import get_jwt_secret
+from app.services.cache import TTLCache
 
 # Bcrypt for NEW passwords
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -14,8 +17,24 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # JWT Configuration
 SECRET_KEY = get_jwt_secret()
 ALGORITHM = "HS256"
+# Built once; passing a str makes python-jose construct the HMAC key per call.
+_SIGNING_KEY = jwk.construct(SECRET_KEY, ALGORITHM)
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+# Recent successful verifications, so retries and scripted clients don't pay
+# the KDF every time. Keys are an HMAC of (hash, password); plaintext is never
+# kept, and a changed hash simply misses.
+_verified_cache = TTLCache(maxsize=1024, ttl=30)
+
+# Decoded payloads of recently seen tokens, keyed by a digest of the token.
+# Each hit re-checks ``exp`` so a cached token never outlives its expiry.
+_token_cache = TTLCache(maxsize=2048, ttl=60)
+
+
+def _verify_cache_key(plain_password: str, hashed_password: str) -> bytes:
+    msg = hashed_password.encode() + b"\0" + plain_password.encode()
+    return hmac.new(SECRET_KEY.encode(), msg, hashlib.sha256).digest()
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -26,6 +45,16 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     if not hashed_password:
         return False
 
+    key = _verify_cache_key(plain_password, hashed_password)
+    if _verified_cache.get(key):
+        return True
+    ok = _check_password(plain_password, hashed_password)
+    if ok:
+        _verified_cache.set(key, True)
+    return ok
+
+
+def _check_password(plain_password: str, hashed_password: str) -> bool:
     # bcrypt
     if hashed_password.startswith("$2b$") or hashed_password.startswith("$2a$"):
         try:
@@ -36,20 +65,29 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     # legacy salt$hash
     try:
         salt, hash_value = hashed_password.split("$", 1)
+        # Compare raw 32-byte digests rather than hex strings.
+        expected = bytes.fromhex(hash_value)
+        salt_bytes, password_bytes = salt.encode(), plain_password.encode()
 
         # PBKDF2-HMAC-SHA256 (100k iterations)
-        computed = hashlib.pbkdf2_hmac("sha256", plain_password.encode(), salt.encode(), 100_000)
-        if secrets.compare_digest(computed.hex(), hash_value):
+        computed = hashlib.pbkdf2_hmac("sha256", password_bytes, salt_bytes, 100_000)
+        if secrets.compare_digest(computed, expected):
             return True
 
-        # fallback: SHA256(salt + password)
-        computed_hash = hashlib.sha256((salt + plain_password).encode()).hexdigest()
-        return secrets.compare_digest(computed_hash, hash_value)
+        # fallback: SHA256(salt + password), fed in pieces to skip the concat
+        h = hashlib.sha256(salt_bytes)
+        h.update(password_bytes)
+        return secrets.compare_digest(h.digest(), expected)
 
     except Exception:
         return False
 
 
+def needs_rehash(hashed_password: str) -> bool:
+    """True for legacy salt$hash values that should be upgraded to bcrypt."""
+    return not (hashed_password.startswith("$2b$") or hashed_password.startswith("$2a$"))
+
+
 def get_password_hash(password: str) -> str:
     """Generate NEW bcrypt hash for new passwords."""
     return pwd_context.hash(password)
@@ -59,12 +97,22 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SIGNING_KEY, algorithm=ALGORITHM)
 
 
 def decode_access_token(token: str) -> Optional[dict]:
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        exp, payload = cached
+        if exp is None or exp > time.time():
+            return dict(payload)
+        _token_cache.pop(key)
+        return None
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = jwt.decode(token, _SIGNING_KEY, algorithms=[ALGORITHM])
     except JWTError:
         return None
+    exp = payload.get("exp")
+    _token_cache.set(key, (exp if isinstance(exp, (int, float)) else None, payload))
+    return dict(payload)
@@ -0,0 +1,75 @@
+"""
+Small in-process TTL cache for read-mostly lookups.
+
+Each worker process keeps its own copy, so entries must be safe to serve
+slightly stale (for up to ``ttl`` seconds) and callers should ``pop`` the
+affected key after writes they know about.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe, size-bounded mapping whose entries expire after ``ttl`` seconds.
+
+    When full, the least recently used entry is evicted. With ``keep_stale``,
+    expired entries are kept (until evicted or popped) so ``get_stale`` can
+    serve the last known value when the source of truth is unavailable.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, keep_stale: bool = False):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.keep_stale = keep_stale
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires_at, value = item
+            if expires_at <= now:
+                if not self.keep_stale:
+                    del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value even if it has expired (needs ``keep_stale``)."""
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            return default if item is _MISSING else item[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def pop_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key satisfies ``predicate``."""
+        with self._lock:
+            for key in [k for k in self._data if predicate(k)]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
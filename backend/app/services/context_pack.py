@@ -1,6 +1,86 @@
+import copy
+from typing import Callable
 from uuid import UUID
+from sqlalchemy import and_, event, literal, select
 from sqlalchemy.orm import Session
 from app.models.org_profile import OrgProfile, RoleProfile
+from app.services.cache import TTLCache
+
+# (org_block, role_block) keyed by (org_id, role_key). Profiles change rarely;
+# the profile write hook below drops an org's entries whenever its profiles
+# are written in this process.
+_profile_cache = TTLCache(maxsize=4096, ttl=120)
+
+_ORG_COLUMNS = (
+    OrgProfile.org_id.label("has_org"),
+    OrgProfile.org_purpose,
+    OrgProfile.industry,
+    OrgProfile.work_environment,
+    OrgProfile.benefits_tags,
+)
+_ROLE_COLUMNS = (
+    RoleProfile.role_key.label("has_role"),
+    RoleProfile.role_family,
+    RoleProfile.seniority_band,
+    RoleProfile.work_pattern,
+    RoleProfile.stressor_profile,
+)
+
+
+def _load_profiles(db: Session, org_id: UUID, role_key: str | None):
+    """Org and (optionally) role profile columns in one round trip.
+
+    Both profiles are outer-joined onto a one-row anchor, so either may be
+    missing and exactly one row still comes back.
+    """
+    anchor = select(literal(1).label("one")).subquery()
+    columns = _ORG_COLUMNS + (_ROLE_COLUMNS if role_key else ())
+    q = (
+        db.query(*columns)
+        .select_from(anchor)
+        .outerjoin(OrgProfile, OrgProfile.org_id == org_id)
+    )
+    if role_key:
+        q = q.outerjoin(
+            RoleProfile,
+            and_(RoleProfile.org_id == org_id, RoleProfile.role_key == role_key),
+        )
+    return q.one()
+
+
+def invalidate_context_pack(org_id: UUID, role_key: str | None = None) -> None:
+    """Drop cached profile blocks after an org or role profile write."""
+    if role_key is None:
+        # An org profile change touches every role key cached for the org.
+        _profile_cache.pop_where(lambda key: key[0] == org_id)
+    else:
+        _profile_cache.pop((org_id, role_key))
+
+
+# Caches derived from org/role profiles subscribe here; each hook gets the
+# org_id of any profile row inserted, updated or deleted in this process.
+_profile_write_hooks: list[Callable[[UUID], None]] = []
+
+
+def on_profile_written(hook: Callable[[UUID], None]) -> Callable[[UUID], None]:
+    """Register ``hook(org_id)`` to run after an org or role profile write."""
+    _profile_write_hooks.append(hook)
+    return hook
+
+
+@event.listens_for(OrgProfile, "after_insert")
+@event.listens_for(OrgProfile, "after_update")
+@event.listens_for(OrgProfile, "after_delete")
+@event.listens_for(RoleProfile, "after_insert")
+@event.listens_for(RoleProfile, "after_update")
+@event.listens_for(RoleProfile, "after_delete")
+def _profile_written(mapper, connection, target) -> None:
+    for hook in _profile_write_hooks:
+        hook(target.org_id)
+
+
+# A role update may also have renamed role_key, so drop the whole org.
+on_profile_written(invalidate_context_pack)
 
 
 def build_context_pack(
@@ -12,35 +92,11 @@ def build_context_pack(
     """Assemble the context pack for LLM module composition (UUID org_id)."""
     session_vars = session_vars or {}
 
-    # Fetch org profile (UUID org_id)
-    org = db.query(OrgProfile).filter(OrgProfile.org_id == org_id).first()
-    org_block = {
-        "purpose": org.org_purpose if org else None,
-        "industry": org.industry if org else None,
-        "work_environment": org.work_environment if org else None,
-        "benefits_tags": org.benefits_tags if org else [],
-    }
-
-    # Fetch role profile (UUID org_id)
-    role_block = {
-        "family": None,
-        "seniority_band": None,
-        "work_pattern": None,
-        "stressor_profile": [],
-    }
-    if role_key:
-        role = (
-            db.query(RoleProfile)
-            .filter(RoleProfile.org_id == org_id, RoleProfile.role_key == role_key)
-            .first()
-        )
-        if role:
-            role_block = {
-                "family": role.role_family,
-                "seniority_band": role.seniority_band,
-                "work_pattern": role.work_pattern,
-                "stressor_profile": role.stressor_profile or [],
-            }
+    cached = _profile_cache.get((org_id, role_key))
+    if cached is None:
+        cached = _profile_blocks(db, org_id, role_key)
+        _profile_cache.set((org_id, role_key), cached)
+    org_block, role_block = copy.deepcopy(cached)
 
     # Session variables
     session_block = {
@@ -55,3 +111,32 @@ def build_context_pack(
         "role": role_block,
         "session": session_block,
     }
+
+
+def _profile_blocks(db: Session, org_id: UUID, role_key: str | None) -> tuple[dict, dict]:
+    row = _load_profiles(db, org_id, role_key)
+
+    # Org profile (UUID org_id)
+    org = row if row.has_org is not None else None
+    org_block = {
+        "purpose": org.org_purpose if org else None,
+        "industry": org.industry if org else None,
+        "work_environment": org.work_environment if org else None,
+        "benefits_tags": org.benefits_tags if org else [],
+    }
+
+    # Role profile (UUID org_id)
+    role_block = {
+        "family": None,
+        "seniority_band": None,
+        "work_pattern": None,
+        "stressor_profile": [],
+    }
+    if role_key and row.has_role is not None:
+        role_block = {
+            "family": row.role_family,
+            "seniority_band": row.seniority_band,
+            "work_pattern": row.work_pattern,
+            "stressor_profile": row.stressor_profile or [],
+        }
+    return org_block, role_block
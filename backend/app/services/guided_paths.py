@@ -1,34 +1,28 @@
+import concurrent.futures
 import logging
-import uuid
-import zlib
+import os
+import time
 from datetime import datetime, timezone
 from typing import Any, Union
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, insert, literal
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Session, joinedload
 
 from app.models.guided_path import GuidedModule, GuidedPathSession
 from app.services.context_pack import build_context_pack
+from app.services.legacy_ids import uuidish_to_int as _uuidish_to_int  # noqa: F401
 from app.services.module_composer import compose_module
 
 logger = logging.getLogger(__name__)
 
-
-def _uuidish_to_int(value: Any, *, fallback: int = 0) -> int:
-    """Stable UUID/string -> 32-bit int for legacy INTEGER columns."""
-    if value is None:
-        return fallback
-    if isinstance(value, int):
-        return value
-    try:
-        u = value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
-        return zlib.crc32(u.bytes) & 0x7FFFFFFF
-    except Exception:
-        try:
-            s = str(value).encode("utf-8", errors="ignore")
-            return zlib.crc32(s) & 0x7FFFFFFF
-        except Exception:
-            return fallback
+# Module composition is an LLM call of several seconds. It runs on this
+# bounded pool so a slow provider cannot hold a request worker for the full
+# HTTP timeout; past COMPOSE_TIMEOUT_SECONDS the session starts on the
+# blueprint steps instead.
+COMPOSE_TIMEOUT_SECONDS = float(os.getenv("COMPOSE_TIMEOUT_SECONDS", "10"))
+_COMPOSE_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=16, thread_name_prefix="compose")
 
 
 def _as_uuid(value: Any) -> UUID:
@@ -55,8 +49,19 @@ def get_module(db: Session, module_id: int):
     return db.query(GuidedModule).filter(GuidedModule.id == module_id).first()
 
 
+def _insert_returning(db: Session, model, values: dict):
+    """ORM INSERT ... RETURNING, then commit.
+
+    One statement instead of add + flush + refresh; the returned instance is
+    persistent in ``db`` like any other loaded row.
+    """
+    obj = db.scalars(insert(model).values(**values).returning(model)).one()
+    db.commit()
+    return obj
+
+
 def create_module(db: Session, org_id: Union[int, UUID, str], created_by: Any, data: dict):
-    module = GuidedModule(
+    return _insert_returning(db, GuidedModule, dict(
         org_id=_as_uuid(org_id),
         name=data["name"],
         category=data["category"],
@@ -67,11 +72,7 @@ def create_module(db: Session, org_id: Union[int, UUID, str], created_by: Any, d
         triggers=data.get("triggers", []),
         safety_checks=data.get("safety_checks", []),
         created_by=_as_uuid(created_by),
-    )
-    db.add(module)
-    db.commit()
-    db.refresh(module)
-    return module
+    ))
 
 
 def update_module(db: Session, module: GuidedModule, data: dict):
@@ -124,9 +125,9 @@ def start_session(
     context_pack = build_context_pack(db, org_uuid, role_key=role_key, session_vars=session_vars)
 
     blueprint_steps = module.steps or []
-    composed_steps = compose_module(blueprint_steps, context_pack, module.name)
+    composed_steps = _compose_with_timeout(blueprint_steps, context_pack, module.name)
 
-    session = GuidedPathSession(
+    return _insert_returning(db, GuidedPathSession, dict(
         user_id=_as_uuid(user_id),
         org_id=org_uuid,
         module_id=module_id,
@@ -138,15 +139,33 @@ def start_session(
         pre_rating=pre_rating,
         theme_category=theme_category,
         available_time=available_time,
-    )
-    db.add(session)
-    db.commit()
-    db.refresh(session)
-    return session
+    ))
 
 
-def get_session(db: Session, session_id: int):
-    return db.query(GuidedPathSession).filter(GuidedPathSession.id == session_id).first()
+def _compose_with_timeout(blueprint_steps: list, context_pack: dict, module_name: str) -> list:
+    started = time.perf_counter()
+    future = _COMPOSE_POOL.submit(compose_module, blueprint_steps, context_pack, module_name)
+    try:
+        composed = future.result(timeout=COMPOSE_TIMEOUT_SECONDS)
+    except concurrent.futures.TimeoutError:
+        # The call keeps running on the pool (and still fills the compose
+        # cache); this request just stops waiting for it.
+        future.cancel()
+        logger.warning(
+            "compose_module for '%s' exceeded %.1fs; using blueprint steps",
+            module_name, COMPOSE_TIMEOUT_SECONDS,
+        )
+        return blueprint_steps
+    logger.debug("compose_module for '%s' took %.3fs", module_name, time.perf_counter() - started)
+    return composed
+
+
+def get_session(db: Session, session_id: int, *, with_module: bool = False):
+    q = db.query(GuidedPathSession)
+    if with_module:
+        # Single-row FK, so a join is cheaper than a second SELECT.
+        q = q.options(joinedload(GuidedPathSession.module))
+    return q.filter(GuidedPathSession.id == session_id).first()
 
 
 def _get_session_steps(session: GuidedPathSession, module: GuidedModule) -> list[dict]:
@@ -170,13 +189,16 @@ def get_module_step(session: GuidedPathSession, module: GuidedModule, step_index
 
 
 def advance_step(db: Session, session: GuidedPathSession, module: GuidedModule, user_response: str | None = None):
-    responses = list(session.responses or [])
-    responses.append({
+    entry = {
         "step": session.current_step,
         "response": user_response,
         "timestamp": datetime.now(timezone.utc).isoformat(),
-    })
-    session.responses = responses
+    }
+    # Append server-side (jsonb ||) instead of rewriting the whole history
+    # from Python on every step.
+    session.responses = func.coalesce(
+        GuidedPathSession.responses, literal([], JSONB)
+    ).op("||")(literal([entry], JSONB))
 
     next_index = session.current_step + 1
     steps = _get_session_steps(session, module)
@@ -186,12 +208,10 @@ def advance_step(db: Session, session: GuidedPathSession, module: GuidedModule,
         session.completed_at = datetime.now(timezone.utc)
         session.current_step = next_index
         db.commit()
-        db.refresh(session)
         return {"completed": True, "session": session}
 
     session.current_step = next_index
     db.commit()
-    db.refresh(session)
 
     step = steps[next_index]
     return {
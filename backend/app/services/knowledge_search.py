@@ -15,8 +15,9 @@ def search_chunks(db: Session, org_id: uuid.UUID, query: str, limit: int = 5) ->
     # Try full-text search first (OR-style so partial matches still rank)
     results = _fts_search(db, org_id, query, limit)
 
-    # Fallback to ILIKE keyword search if no FTS results
-    if not results:
+    # Fallback to ILIKE keyword search if no FTS results. One- and two-letter
+    # queries would match nearly every chunk, so don't scan for them.
+    if not results and len(query.strip()) >= 3:
         results = _ilike_search(db, org_id, query, limit)
 
     logger.debug("KB search for '%s': %d chunks found", query[:60], len(results))
@@ -33,29 +34,32 @@ _STOP_WORDS = {
 }
 
 
+# Built once; only parameters are bound per search.
+_FTS_SQL = sa_text("""
+    SELECT dc.id, dc.document_id, dc.chunk_index, dc.content, dc.token_count,
+           ts_rank(dc.content_tsv, q) AS rank
+    FROM document_chunks dc, websearch_to_tsquery('english', :or_query) q
+    WHERE dc.org_id = :org_id
+      AND dc.content_tsv @@ q
+    ORDER BY rank DESC
+    LIMIT :limit
+""")
+
+
 def _fts_search(db: Session, org_id: uuid.UUID, query: str, limit: int) -> list[dict]:
     # Build an OR-style tsquery so chunks matching ANY keyword are returned,
     # ranked by how many keywords match. This replaces the old AND-style
     # plainto_tsquery which required ALL words to be present in a chunk.
+    # websearch_to_tsquery never raises on odd punctuation, unlike to_tsquery
+    # fed the raw query.
     words = [w for w in query.lower().split() if w.isalpha() and w not in _STOP_WORDS]
     if not words:
         or_query = query
     else:
-        # " | " is the OR operator in tsquery syntax
-        or_query = " | ".join(words[:8])
-
-    sql = sa_text("""
-        SELECT dc.id, dc.document_id, dc.chunk_index, dc.content, dc.token_count,
-               ts_rank(to_tsvector('english', dc.content),
-                       to_tsquery('english', :or_query)) AS rank
-        FROM document_chunks dc
-        WHERE dc.org_id = :org_id
-          AND to_tsvector('english', dc.content) @@ to_tsquery('english', :or_query)
-        ORDER BY rank DESC
-        LIMIT :limit
-    """)
-
-    rows = db.execute(sql, {
+        # "or" is the OR operator in websearch_to_tsquery syntax
+        or_query = " or ".join(words[:8])
+
+    rows = db.execute(_FTS_SQL, {
         "org_id": org_id,
         "or_query": or_query,
         "limit": limit,
@@ -84,7 +88,13 @@ def _ilike_search(db: Session, org_id: uuid.UUID, query: str, limit: int) -> lis
     conditions = [DocumentChunk.content.ilike(f"%{w}%") for w in words[:6]]
 
     chunks = (
-        db.query(DocumentChunk)
+        db.query(
+            DocumentChunk.id,
+            DocumentChunk.document_id,
+            DocumentChunk.chunk_index,
+            DocumentChunk.content,
+            DocumentChunk.token_count,
+        )
         .filter(DocumentChunk.org_id == org_id, or_(*conditions))
         .limit(limit)
         .all()
@@ -103,8 +113,25 @@ def _ilike_search(db: Session, org_id: uuid.UUID, query: str, limit: int) -> lis
     ]
 
 
+def load_documents_for_chunks(db: Session, chunks: list[dict]) -> dict[int, Document]:
+    """Fetch id/title/version for every document cited by ``chunks`` in one query."""
+    ids = {c["document_id"] for c in chunks}
+    if not ids:
+        return {}
+    rows = (
+        db.query(Document.id, Document.title, Document.version)
+        .filter(Document.id.in_(ids))
+        .all()
+    )
+    return {r.id: r for r in rows}
+
+
 def format_kb_context(chunks: list[dict], documents: dict[int, Document]) -> str:
-    """Format search results as prompt context with source citations."""
+    """Format search results as prompt context with source citations.
+
+    ``documents`` should come from ``load_documents_for_chunks``; only
+    ``title`` and ``version`` are read from each entry.
+    """
     if not chunks:
         return ""
 
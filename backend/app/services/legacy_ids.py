@@ -0,0 +1,45 @@
+"""
+UUID -> 32-bit int bridge for the legacy INTEGER org_id/user_id columns
+(guided_modules, guided_path_sessions).
+"""
+
+import uuid
+import zlib
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=4096)
+def _str_to_int(value: str) -> int:
+    """Cached string half of ``uuidish_to_int``; the same few org/user ids repeat."""
+    # Plain 32-hex / hyphenated ids: decode directly instead of building a UUID.
+    hex_digits = value.replace("-", "")
+    if len(hex_digits) == 32:
+        try:
+            raw = bytes.fromhex(hex_digits)
+        except ValueError:
+            raw = b""
+        if len(raw) == 16:
+            return zlib.crc32(raw) & 0x7FFFFFFF
+    try:
+        return zlib.crc32(uuid.UUID(value).bytes) & 0x7FFFFFFF
+    except ValueError:
+        return zlib.crc32(value.encode("utf-8", errors="ignore")) & 0x7FFFFFFF
+
+
+def uuidish_to_int(value: Any, *, fallback: int = 0) -> int:
+    """Convert a UUID/UUID-string to a stable non-negative 32-bit int."""
+    if value is None:
+        return fallback
+    if value.__class__ is uuid.UUID:
+        return zlib.crc32(value.bytes) & 0x7FFFFFFF
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        return _str_to_int(value)
+    if isinstance(value, uuid.UUID):
+        return zlib.crc32(value.bytes) & 0x7FFFFFFF
+    try:
+        return _str_to_int(str(value))
+    except Exception:
+        return fallback
@@ -5,6 +5,7 @@ CRITICAL: This service NEVER accesses wellbeing data (conversations, guided path
 crisis events, stress ratings). The firewall is architectural, not just policy.
 """
 
+import copy
 import os
 import json
 import logging
@@ -12,16 +13,18 @@ import uuid
 from datetime import date, datetime
 from uuid import UUID
 
-import httpx
+import orjson
+from sqlalchemy import event, literal, select, true
 from sqlalchemy.orm import Session
 from app.models.performance import PerformanceEvaluation
 from app.models.org_profile import OrgProfile, RoleProfile
 from app.models.toolkit import CoachingSession
+from app.services.cache import TTLCache
+from app.services.context_pack import on_profile_written
+from app.services.openai_http import OPENAI_API_KEY, OPENAI_CHAT_URL, OPENAI_HEADERS, http_client
 
 logger = logging.getLogger(__name__)
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "").strip()
-OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com").strip().rstrip("/")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip()
 
 
@@ -48,6 +51,30 @@ Respond in valid JSON with this structure:
 }"""
 
 
+# Assembled contexts keyed by (org_id, employee_user_id). Managers tend to ask
+# several follow-ups about the same person; the evaluation events and profile
+# write hook below drop entries whenever the underlying rows are written in
+# this process.
+_context_cache = TTLCache(maxsize=1024, ttl=180)
+
+
+def invalidate_manager_context(org_id: uuid.UUID, employee_user_id: uuid.UUID) -> None:
+    _context_cache.pop((org_id, employee_user_id))
+
+
+@event.listens_for(PerformanceEvaluation, "after_insert")
+@event.listens_for(PerformanceEvaluation, "after_update")
+@event.listens_for(PerformanceEvaluation, "after_delete")
+def _evaluation_written(mapper, connection, target) -> None:
+    invalidate_manager_context(target.org_id, target.user_id)
+
+
+@on_profile_written
+def invalidate_manager_org(org_id: uuid.UUID) -> None:
+    # Profiles feed every employee's context in the org.
+    _context_cache.pop_where(lambda key: key[0] == org_id)
+
+
 def assemble_manager_context(
     db: Session,
     manager_user_id: uuid.UUID,
@@ -63,6 +90,15 @@ def assemble_manager_context(
 
     ZERO: conversations, guided paths, crisis events, stress ratings.
     """
+    key = (org_id, employee_user_id)
+    cached = _context_cache.get(key)
+    if cached is None:
+        cached = _load_manager_context(db, employee_user_id, org_id)
+        _context_cache.set(key, cached)
+    return copy.deepcopy(cached)
+
+
+def _load_manager_context(db: Session, employee_user_id: uuid.UUID, org_id: uuid.UUID) -> dict:
     context = {
         "employee_user_id": employee_user_id,
         "evaluations": [],
@@ -72,7 +108,13 @@ def assemble_manager_context(
 
     # Load performance evaluations
     evaluations = (
-        db.query(PerformanceEvaluation)
+        db.query(
+            PerformanceEvaluation.evaluation_period,
+            PerformanceEvaluation.overall_rating,
+            PerformanceEvaluation.strengths,
+            PerformanceEvaluation.areas_for_improvement,
+            PerformanceEvaluation.goals_for_next_period,
+        )
         .filter(
             PerformanceEvaluation.user_id == employee_user_id,
             PerformanceEvaluation.org_id == org_id,
@@ -90,31 +132,46 @@ def assemble_manager_context(
             "goals": ev.goals_for_next_period,
         })
 
-    # Load org context
-    org_profile = (
-        db.query(OrgProfile)
-        .filter(OrgProfile.org_id == org_id)
-        .first()
+    # Load org context and the org's first role profile (general context) in
+    # one round trip: both are outer-joined onto a one-row anchor.
+    anchor = select(literal(1).label("one")).subquery()
+    first_role = (
+        select(
+            RoleProfile.role_key,
+            RoleProfile.seniority_band,
+            RoleProfile.work_pattern,
+            RoleProfile.stressor_profile,
+        )
+        .where(RoleProfile.org_id == org_id)
+        .order_by(RoleProfile.role_key)
+        .limit(1)
+        .subquery()
+    )
+    profiles = (
+        db.query(
+            OrgProfile.org_id.label("has_org"),
+            OrgProfile.industry,
+            OrgProfile.work_environment,
+            first_role.c.seniority_band,
+            first_role.c.work_pattern,
+            first_role.c.stressor_profile,
+            first_role.c.role_key.label("has_role"),
+        )
+        .select_from(anchor)
+        .outerjoin(OrgProfile, OrgProfile.org_id == org_id)
+        .outerjoin(first_role, true())
+        .one()
     )
-    if org_profile:
+    if profiles.has_org is not None:
         context["org_context"] = {
-            "industry": org_profile.industry,
-            "work_environment": org_profile.work_environment,
+            "industry": profiles.industry,
+            "work_environment": profiles.work_environment,
         }
-
-    # Load role profiles (all for the org — pick most relevant if needed)
-    role_profiles = (
-        db.query(RoleProfile)
-        .filter(RoleProfile.org_id == org_id)
-        .all()
-    )
-    if role_profiles:
-        # Use first role profile as general context
-        rp = role_profiles[0]
+    if profiles.has_role is not None:
         context["role_context"] = {
-            "seniority_band": rp.seniority_band,
-            "work_pattern": rp.work_pattern,
-            "stressor_profile": rp.stressor_profile,
+            "seniority_band": profiles.seniority_band,
+            "work_pattern": profiles.work_pattern,
+            "stressor_profile": profiles.stressor_profile,
         }
 
     return context
@@ -184,12 +241,6 @@ def generate_coaching_plan(
 
     if OPENAI_API_KEY:
         try:
-            base = OPENAI_BASE_URL.rstrip("/")
-            openai_url = f"{base}/v1/chat/completions" if "/v1" not in base else f"{base}/chat/completions"
-            headers = {
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {OPENAI_API_KEY}",
-            }
             payload = {
                 "model": OPENAI_MODEL,
                 "max_tokens": 2048,
@@ -200,16 +251,15 @@ def generate_coaching_plan(
                 "response_format": {"type": "json_object"},
             }
 
-            with httpx.Client() as client:
-                r = client.post(openai_url, headers=headers, json=payload, timeout=60)
+            r = http_client.post(OPENAI_CHAT_URL, headers=OPENAI_HEADERS, json=payload)
 
             if r.status_code < 400:
-                data = r.json()
+                data = orjson.loads(r.content)
                 ai_response_text = (data.get("choices") or [{}])[0].get("message", {}).get("content", "")
 
                 try:
-                    structured = json.loads(ai_response_text) if ai_response_text else {}
-                except json.JSONDecodeError:
+                    structured = orjson.loads(ai_response_text) if ai_response_text else {}
+                except orjson.JSONDecodeError:
                     structured = {
                         "situation_summary": ai_response_text[:500],
                         "conversation_script": "",
@@ -13,7 +13,8 @@ super_admin bypasses all scope checks.
 import logging
 from typing import Optional
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 
 from app.models.toolkit import ManagerConfig
 
@@ -39,7 +40,29 @@ def _is_super_admin(db: Session, user_id: UUID) -> bool:
 
 
 def get_manager_config(db: Session, user_id: UUID, org_id: UUID) -> ManagerConfig | None:
-    """Get active manager configuration for a user. super_admin bypasses."""
+    """Get active manager configuration for a user. super_admin bypasses.
+
+    Memoized on the session (one per request), since a single request often
+    checks employee access, data types and features in turn.
+    """
+    cache = db.info.setdefault("manager_config", {})
+    key = (user_id, org_id)
+    if key not in cache:
+        cache[key] = _load_manager_config(db, user_id, org_id)
+    return cache[key]
+
+
+@event.listens_for(ManagerConfig, "after_insert")
+@event.listens_for(ManagerConfig, "after_update")
+@event.listens_for(ManagerConfig, "after_delete")
+def _manager_config_written(mapper, connection, target) -> None:
+    # Drop the memoized entry so a later check in the same request re-reads it.
+    db = object_session(target)
+    if db is not None:
+        db.info.get("manager_config", {}).pop((target.user_id, target.org_id), None)
+
+
+def _load_manager_config(db: Session, user_id: UUID, org_id: UUID) -> ManagerConfig | None:
     config = (
         db.query(ManagerConfig)
         .filter(
@@ -1,19 +1,25 @@
 import os
+import copy
+import hashlib
 import json
 import logging
-import httpx
+import orjson
 from dotenv import load_dotenv
 from pathlib import Path
+from app.services.cache import TTLCache
+from app.services.openai_http import OPENAI_API_KEY, OPENAI_CHAT_URL, OPENAI_HEADERS, http_client
 from app.services.safety_gate import check_composed_content
 
 load_dotenv(dotenv_path=Path(__file__).parent.parent.parent / ".env", override=True)
 
 logger = logging.getLogger(__name__)
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "").strip()
-OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com").strip().rstrip("/")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini").strip()
 
+# Successful compositions keyed by a digest of everything sent to the LLM, so
+# restarting the same module with the same context skips the call entirely.
+_compose_cache = TTLCache(maxsize=512, ttl=24 * 3600)
+
 COMPOSER_SYSTEM_PROMPT = """You are the Rafiki Module Composer.
 You receive a module blueprint (fixed psychological structure) and a context pack.
 Your job: adapt the wording, examples, scenarios, and micro-actions to fit the context.
@@ -44,19 +50,39 @@ def compose_module(
         logger.warning("OpenAI not configured — returning raw blueprint")
         return blueprint_steps
 
+    key = _compose_key(blueprint_steps, context_pack, module_name)
+    cached = _compose_cache.get(key)
+    if cached is not None:
+        return copy.deepcopy(cached)
+
+    adapted_steps = _compose_with_llm(blueprint_steps, context_pack, module_name)
+    # Fallbacks return the blueprint itself; only cache real adaptations.
+    if adapted_steps is not blueprint_steps:
+        _compose_cache.set(key, copy.deepcopy(adapted_steps))
+    return adapted_steps
+
+
+def _compose_key(blueprint_steps: list[dict], context_pack: dict, module_name: str) -> bytes:
+    body = orjson.dumps(
+        {"m": module_name, "s": blueprint_steps, "c": context_pack, "model": OPENAI_MODEL},
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS,
+        default=str,
+    )
+    return hashlib.blake2b(body, digest_size=16).digest()
+
+
+def _compose_with_llm(
+    blueprint_steps: list[dict],
+    context_pack: dict,
+    module_name: str,
+) -> list[dict]:
     user_prompt = json.dumps({
         "module_name": module_name,
         "context_pack": context_pack,
         "blueprint_steps": blueprint_steps,
-    }, indent=2)
+    }, separators=(",", ":"), ensure_ascii=False)  # compact: whitespace costs tokens
 
     try:
-        base = OPENAI_BASE_URL.rstrip("/")
-        openai_url = f"{base}/v1/chat/completions" if "/v1" not in base else f"{base}/chat/completions"
-        headers = {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {OPENAI_API_KEY}",
-        }
         payload = {
             "model": OPENAI_MODEL,
             "max_tokens": 4096,
@@ -66,7 +92,7 @@ def compose_module(
             ],
         }
 
-        r = httpx.post(openai_url, headers=headers, json=payload, timeout=60)
+        r = http_client.post(OPENAI_CHAT_URL, headers=OPENAI_HEADERS, json=payload)
 
         if r.status_code >= 400:
             logger.error("Composer LLM error (%d): %s", r.status_code, r.text[:300])
@@ -87,20 +113,21 @@ def compose_module(
                          len(adapted_steps), len(blueprint_steps))
             return blueprint_steps
 
+        # Safety gate first (it only reads message text); a rejection needs no
+        # further work on the adapted steps
+        is_safe, violations = check_composed_content(adapted_steps, early_exit=True)
+        if not is_safe:
+            logger.warning("Safety gate failed: %s — falling back to blueprint", violations)
+            return blueprint_steps
+
         # Preserve structural fields from blueprint
-        for i, (adapted, original) in enumerate(zip(adapted_steps, blueprint_steps)):
+        for adapted, original in zip(adapted_steps, blueprint_steps):
             adapted["type"] = original["type"]
             adapted["expected_input"] = original.get("expected_input")
             adapted["safety_check"] = original.get("safety_check", False)
             if original.get("media_url"):
                 adapted["media_url"] = original["media_url"]
 
-        # Safety gate
-        is_safe, violations = check_composed_content(adapted_steps)
-        if not is_safe:
-            logger.warning("Safety gate failed: %s — falling back to blueprint", violations)
-            return blueprint_steps
-
         return adapted_steps
 
     except json.JSONDecodeError as e:
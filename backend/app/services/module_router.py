@@ -1,9 +1,10 @@
 import uuid
-import zlib
-from typing import Any, Union
+from typing import Union
 
+from sqlalchemy import and_, case, func, literal
 from sqlalchemy.orm import Session
 from app.models.guided_path import GuidedModule
+from app.services.legacy_ids import uuidish_to_int as _uuidish_to_int  # noqa: F401
 
 ROUTING_RULES = {
     "anxiety": ["anxiety_relief", "breathing_reset", "grounding_exercise"],
@@ -15,6 +16,12 @@ ROUTING_RULES = {
     "workload": ["burnout_check", "boundary_setting", "time_audit"],
 }
 
+# Theme → set of preferred categories, for O(1) membership while scoring
+THEME_TO_CATEGORY_SET = {t: frozenset(cats) for t, cats in ROUTING_RULES.items()}
+
+# Calming categories boosted for high/crisis stress
+HIGH_STRESS_CATEGORIES = frozenset({"breathing_reset", "grounding_exercise", "stress_decompress"})
+
 # Category name → themes it matches
 CATEGORY_TO_THEMES = {}
 for theme, categories in ROUTING_RULES.items():
@@ -22,28 +29,6 @@ for theme, categories in ROUTING_RULES.items():
         CATEGORY_TO_THEMES.setdefault(cat, []).append(theme)
 
 
-def _uuidish_to_int(value: Any, *, fallback: int = 0) -> int:
-    """
-    Convert UUID/UUID-string to a stable non-negative 32-bit int
-    for legacy INTEGER org_id columns (guided_modules.org_id).
-    """
-    if value is None:
-        return fallback
-
-    if isinstance(value, int):
-        return value
-
-    try:
-        u = value if isinstance(value, uuid.UUID) else uuid.UUID(str(value))
-        return zlib.crc32(u.bytes) & 0x7FFFFFFF
-    except Exception:
-        try:
-            s = str(value).encode("utf-8", errors="ignore")
-            return zlib.crc32(s) & 0x7FFFFFFF
-        except Exception:
-            return fallback
-
-
 def suggest_modules(
     db: Session,
     org_id: Union[int, uuid.UUID, str],
@@ -54,75 +39,64 @@ def suggest_modules(
     """Rules-based module suggestion. Returns ranked list of modules."""
     org_uuid = uuid.UUID(str(org_id)) if not isinstance(org_id, uuid.UUID) else org_id
 
-    # Get all active modules for this org (including globals)
-    modules = (
+    theme_lower = theme.lower() if theme else None
+    preferred = THEME_TO_CATEGORY_SET.get(theme_lower, frozenset())
+
+    # Same rules as before, scored by Postgres so only the top 3 rows come back.
+    cat = func.replace(func.lower(func.coalesce(GuidedModule.category, "")), " ", "_")
+    duration = GuidedModule.duration_minutes
+    has_duration = and_(duration.isnot(None), duration != 0)
+    score = literal(1)  # default base score for active modules
+
+    # Theme match
+    if theme_lower:
+        name_match = func.strpos(func.lower(func.coalesce(GuidedModule.name, "")), theme_lower) > 0
+        whens = [(cat.in_(sorted(preferred)), 10)] if preferred else []
+        score = score + case(*whens, (name_match, 5), else_=0)
+
+    # Time filter — prefer modules that fit available time, penalize too-long ones
+    if available_time:
+        score = score + case(
+            (and_(has_duration, duration <= available_time), 3),
+            (has_duration, -5),
+            else_=0,
+        )
+
+    # High stress → prefer shorter calming modules
+    if stress_band in ("high", "crisis"):
+        score = score + case((cat.in_(sorted(HIGH_STRESS_CATEGORIES)), 5), else_=0)
+        score = score + case((and_(has_duration, duration <= 5), 2), else_=0)
+
+    # Active modules for this org (including globals), top 3 by score
+    top = (
         db.query(GuidedModule)
         .filter(
             (GuidedModule.org_id == org_uuid) | (GuidedModule.org_id.is_(None)),
             GuidedModule.is_active == True,
         )
+        .order_by(score.desc(), GuidedModule.id)
+        .limit(3)
         .all()
     )
 
-    if not modules:
-        return []
-
-    # Score each module
-    scored: list[dict] = []
-    for mod in modules:
-        score = 0
-        reason = ""
-        cat = (mod.category or "").lower().replace(" ", "_")
-
-        # Theme match
-        if theme:
-            theme_lower = theme.lower()
-            preferred = ROUTING_RULES.get(theme_lower, [])
-            if cat in preferred:
-                score += 10
-                reason = f"Matches theme: {theme}"
-            elif theme_lower in (mod.name or "").lower():
-                score += 5
-                reason = f"Name matches theme: {theme}"
-
-        # Time filter — prefer modules that fit available time
-        if available_time and mod.duration_minutes:
-            if mod.duration_minutes <= available_time:
-                score += 3
-            else:
-                score -= 5  # penalize too-long modules
-
-        # High stress → prefer shorter calming modules
-        if stress_band in ("high", "crisis"):
-            if cat in ("breathing_reset", "grounding_exercise", "stress_decompress"):
-                score += 5
-            if mod.duration_minutes and mod.duration_minutes <= 5:
-                score += 2
-
-        # Default base score for active modules
-        score += 1
-
-        scored.append(
-            {
-                "module": mod,
-                "score": score,
-                "reason": reason or "Available module",
-            }
-        )
-
-    # Sort by score descending, take top 3
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    top = scored[:3]
-
     return [
         {
-            "id": s["module"].id,
-            "name": s["module"].name,
-            "category": s["module"].category,
-            "description": s["module"].description,
-            "duration_minutes": s["module"].duration_minutes,
-            "icon": s["module"].icon,
-            "match_reason": s["reason"],
+            "id": mod.id,
+            "name": mod.name,
+            "category": mod.category,
+            "description": mod.description,
+            "duration_minutes": mod.duration_minutes,
+            "icon": mod.icon,
+            "match_reason": _match_reason(mod, theme, theme_lower, preferred),
         }
-        for s in top
+        for mod in top
     ]
+
+
+def _match_reason(mod: GuidedModule, theme: str | None, theme_lower: str | None, preferred: frozenset) -> str:
+    if theme_lower:
+        if (mod.category or "").lower().replace(" ", "_") in preferred:
+            return f"Matches theme: {theme}"
+        if theme_lower in (mod.name or "").lower():
+            return f"Name matches theme: {theme}"
+    return "Available module"
@@ -0,0 +1,32 @@
+"""
+Shared HTTP plumbing for OpenAI-compatible chat completions.
+
+One pooled client per process, so every service reuses kept-alive
+connections instead of paying a TCP + TLS handshake per call.
+"""
+
+import os
+from pathlib import Path
+
+import httpx
+from dotenv import load_dotenv
+
+load_dotenv(dotenv_path=Path(__file__).parent.parent.parent / ".env", override=True)
+
+OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "").strip()
+OPENAI_BASE_URL = os.getenv("OPENAI_BASE_URL", "https://api.openai.com").strip().rstrip("/")
+
+OPENAI_CHAT_URL = (
+    f"{OPENAI_BASE_URL}/v1/chat/completions"
+    if "/v1" not in OPENAI_BASE_URL
+    else f"{OPENAI_BASE_URL}/chat/completions"
+)
+OPENAI_HEADERS = {
+    "Content-Type": "application/json",
+    "Authorization": f"Bearer {OPENAI_API_KEY}",
+}
+
+http_client = httpx.Client(
+    timeout=httpx.Timeout(60.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+)
@@ -9,65 +9,83 @@ Supported:
 - .pdf  (pdfplumber) best-effort table extraction
 """
 import csv
+import importlib
 import io
 import logging
 import re
+from dataclasses import dataclass
+from functools import cache
+from itertools import chain, islice
 from typing import Optional, Tuple
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from app.models.user import User
 
 logger = logging.getLogger(__name__)
 
 # ---- Optional imports (keep server from crashing if missing) ----
-try:
-    import openpyxl  # .xlsx
-except ImportError:
-    openpyxl = None
-
-try:
-    import xlrd  # .xls (legacy Excel)
-except ImportError:
-    xlrd = None
-
-try:
-    import docx  # python-docx for .docx
-except ImportError:
-    docx = None
-
-try:
-    import pdfplumber  # for .pdf table extraction
-except ImportError:
-    pdfplumber = None
+# Imported on first use so workers that never parse payroll don't load them.
+@cache
+def _optional_import(name: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
 
 
 def _normalize_name(name: str) -> str:
     return " ".join(name.strip().lower().split())
 
 
+# Deletes every ASCII character except digits, "." and "-" in one pass.
+_NUMERIC_ASCII_ONLY = {c: None for c in range(128) if chr(c) not in "0123456789.-"}
+_NON_NUMERIC_RE = re.compile(r"[^\d.\-]")
+
+
 def _parse_number(val) -> float:
     """Parse numbers like '1,234.56' or '1 234.56' safely."""
     if isinstance(val, (int, float)):
         return float(val)
     try:
-        cleaned = str(val).replace(",", "").replace(" ", "").strip()
-        # strip currency symbols
-        cleaned = re.sub(r"[^\d.\-]", "", cleaned)
+        cleaned = str(val).translate(_NUMERIC_ASCII_ONLY)
+        # non-ASCII currency symbols (e.g. €) still need the regex
+        if not cleaned.isascii():
+            cleaned = _NON_NUMERIC_RE.sub("", cleaned)
         return float(cleaned) if cleaned else 0.0
     except (ValueError, TypeError):
         return 0.0
 
 
+# Names per IN (...) when matching payroll entries to users.
+_MATCH_CHUNK = 1000
+
+
 def _match_employees(entries: list[dict], db: Session, org_id) -> list[dict]:
     """
     For each parsed entry, try to match employee_name to users_legacy.name
     within the same org. Adds matched_user_id (str | None) to each entry.
     """
-    users = db.query(User).filter(User.org_id == org_id, User.is_active == True).all()
+    needed = {_normalize_name(e["employee_name"]) for e in entries}
+    needed.discard("")
     name_map = {}
-    for u in users:
-        if u.name:
-            name_map[_normalize_name(u.name)] = str(u.user_id)
+    # Only fetch users whose name can match something in the file. The SQL
+    # expression mirrors _normalize_name and is covered by
+    # ix_users_legacy_org_normalized_name.
+    norm_name = func.lower(func.btrim(func.regexp_replace(User.name, r"\s+", " ", "g")))
+    needed_list = sorted(needed)
+    for i in range(0, len(needed_list), _MATCH_CHUNK):
+        rows = (
+            db.query(User.user_id, User.name)
+            .filter(
+                User.org_id == org_id,
+                User.is_active == True,
+                norm_name.in_(needed_list[i:i + _MATCH_CHUNK]),
+            )
+            .all()
+        )
+        for user_id, name in rows:
+            name_map[_normalize_name(name)] = str(user_id)
 
     for entry in entries:
         norm = _normalize_name(entry["employee_name"])
@@ -77,10 +95,18 @@ def _match_employees(entries: list[dict], db: Session, org_id) -> list[dict]:
 
 
 def _build_summary(entries: list[dict]) -> dict:
-    total_gross = sum(e["gross_salary"] for e in entries)
-    total_deductions = sum(e["deductions"] for e in entries)
-    total_net = sum(e["net_salary"] for e in entries)
-    unmatched = [e["employee_name"] for e in entries if not e.get("matched_user_id")]
+    # One pass over the entries for all totals and the match split.
+    total_gross = total_deductions = total_net = 0
+    matched_count = 0
+    unmatched = []
+    for e in entries:
+        total_gross += e["gross_salary"]
+        total_deductions += e["deductions"]
+        total_net += e["net_salary"]
+        if e.get("matched_user_id"):
+            matched_count += 1
+        else:
+            unmatched.append(e["employee_name"])
 
     expected_net = total_gross - total_deductions
     # Tolerance: 1% of total gross or 1.0, whichever is larger — handles rounding & other additions
@@ -93,7 +119,7 @@ def _build_summary(entries: list[dict]) -> dict:
         "total_deductions": round(total_deductions, 2),
         "total_net": round(total_net, 2),
         "employee_count": len(entries),
-        "matched_count": sum(1 for e in entries if e.get("matched_user_id")),
+        "matched_count": matched_count,
         "unmatched_names": unmatched,
         "reconciled": reconciled,
     }
@@ -109,53 +135,85 @@ def _normalize_header(h) -> str:
     return str(h).strip().lower().replace(" ", "_").replace(".", "_")
 
 
-def _row_to_entry(normed: dict) -> Optional[dict]:
+_NAME_KEYS = ("employee_name", "name", "employee")
+_GROSS_KEYS = ("gross_salary", "gross", "gross_pay", "gross_sal", "gross_sal_")
+_NET_KEYS = ("net_salary", "net", "net_pay")
+_DEDUCTION_KEYS = ("paye", "nssf", "shif", "nhdf", "nhif", "levy", "loan", "deduction")
+_KNOWN_KEYS = frozenset(_NAME_KEYS + _GROSS_KEYS + _NET_KEYS + ("deductions", "deduction"))
+
+
+@dataclass(frozen=True)
+class _Schema:
+    """Column positions for one header row, resolved once per table."""
+    name_idxs: tuple[int, ...]
+    gross_idxs: tuple[int, ...]
+    net_idxs: tuple[int, ...]
+    deductions_idx: int
+    deduction_idx: int
+    deduction_idxs: tuple[int, ...]
+    detail_cols: tuple[tuple[str, int], ...]
+
+
+def _resolve_schema(headers: list[str]) -> _Schema:
+    # Later duplicates win, as they did when rows were keyed by header.
+    pos = {h: i for i, h in enumerate(headers)}
+    return _Schema(
+        name_idxs=tuple(pos[k] for k in _NAME_KEYS if k in pos),
+        gross_idxs=tuple(pos[k] for k in _GROSS_KEYS if k in pos),
+        net_idxs=tuple(pos[k] for k in _NET_KEYS if k in pos),
+        deductions_idx=pos.get("deductions", -1),
+        deduction_idx=pos.get("deduction", -1),
+        deduction_idxs=tuple(i for h, i in pos.items() if any(dk in h for dk in _DEDUCTION_KEYS)),
+        detail_cols=tuple((h, i) for h, i in pos.items() if h not in _KNOWN_KEYS),
+    )
+
+
+def _cell(row, i: int):
+    return row[i] if 0 <= i < len(row) else None
+
+
+def _first(row, idxs: tuple[int, ...]):
+    for i in idxs:
+        v = _cell(row, i)
+        if v:
+            return v
+    return None
+
+
+def _row_to_entry(row, schema: _Schema) -> Optional[dict]:
     """
-    Convert a normalized row dict to a payroll entry.
+    Convert a data row to a payroll entry using column positions from ``schema``.
     Expected columns (case-insensitive, spaces/dots normalized to _):
       employee_name (or name, employee), gross_salary (or gross, gross_sal), deductions (or deduction), net_salary (or net)
     """
-    name = (
-        normed.get("employee_name") or normed.get("name") or normed.get("employee") or ""
-    )
+    name = _first(row, schema.name_idxs) or ""
     if isinstance(name, (int, float)):
         name = str(name)
     name = str(name).strip()
     if not name:
         return None
 
-    gross = _parse_number(
-        normed.get("gross_salary")
-        or normed.get("gross")
-        or normed.get("gross_pay")
-        or normed.get("gross_sal")
-        or normed.get("gross_sal_")
-        or 0
-    )
+    gross = _parse_number(_first(row, schema.gross_idxs) or 0)
     # Single total deduction column (deductions or deduction) or sum of statutory columns
-    if normed.get("deductions") not in (None, ""):
-        deductions = _parse_number(normed["deductions"])
-    elif normed.get("deduction") not in (None, ""):
-        deductions = _parse_number(normed["deduction"])
+    if _cell(row, schema.deductions_idx) not in (None, ""):
+        deductions = _parse_number(_cell(row, schema.deductions_idx))
+    elif _cell(row, schema.deduction_idx) not in (None, ""):
+        deductions = _parse_number(_cell(row, schema.deduction_idx))
     else:
-        deduction_keys = {"paye", "nssf", "shif", "nhdf", "nhif", "levy", "loan", "deduction"}
         deductions = sum(
             abs(_parse_number(v))
-            for k, v in normed.items()
-            if any(dk in k for dk in deduction_keys) and v not in (None, "")
+            for v in (_cell(row, i) for i in schema.deduction_idxs)
+            if v not in (None, "")
         )
-    net = _parse_number(
-        normed.get("net_salary") or normed.get("net") or normed.get("net_pay") or 0
-    )
+    net = _parse_number(_first(row, schema.net_idxs) or 0)
 
-    known_keys = {
-        "employee_name", "name", "employee",
-        "gross_salary", "gross", "gross_pay", "gross_sal", "gross_sal_",
-        "deductions", "deduction",
-        "net_salary", "net", "net_pay",
-    }
-    details = {k: (str(v).strip() if v is not None else "") for k, v in normed.items() if k not in known_keys}
-    details = {k: v for k, v in details.items() if v}
+    details = {}
+    for h, i in schema.detail_cols:
+        v = _cell(row, i)
+        if v is not None:
+            v = str(v).strip()
+            if v:
+                details[h] = v
 
     return {
         "employee_name": name,
@@ -172,17 +230,18 @@ def _row_to_entry(normed: dict) -> Optional[dict]:
 
 def parse_csv_payroll(content: bytes, db: Session, org_id) -> dict:
     text = content.decode("utf-8-sig", errors="ignore")
-    reader = csv.DictReader(io.StringIO(text))
+    # Plain reader; columns are resolved once from the header row.
+    reader = csv.reader(io.StringIO(text, newline=""))
+    raw_headers = next(reader, None)
 
-    if not reader.fieldnames:
+    if not raw_headers:
         return {"entries": [], "total_gross": 0, "total_deductions": 0, "total_net": 0, "unmatched_names": []}
 
-    col_map = {col: _normalize_header(col) for col in reader.fieldnames}
+    schema = _resolve_schema([_normalize_header(h) for h in raw_headers])
 
     entries = []
     for row in reader:
-        normed = {col_map.get(k, k): (v.strip() if isinstance(v, str) else v) for k, v in row.items()}
-        entry = _row_to_entry(normed)
+        entry = _row_to_entry([v.strip() for v in row], schema)
         if entry:
             entries.append(entry)
 
@@ -217,22 +276,27 @@ def _build_combined_headers(rows: list, header_idx: int) -> list:
     return headers
 
 
+_PAYROLL_KEYWORDS = ("name", "gross", "net", "salary", "pay", "employee")
+
+
 def _find_header_row(rows: list) -> int:
     """
     Find the best header row index in the first 15 rows.
-    Prefer rows that contain payroll-specific keywords.
+    Prefer rows that contain payroll-specific keywords; a row with three or
+    more keyword cells is taken as soon as it is seen.
     """
-    PAYROLL_KEYWORDS = {"name", "gross", "net", "salary", "pay", "employee"}
     best_idx = None
     best_score = -1
 
     for i, row in enumerate(rows[:15]):
-        str_cells = [c for c in row if c is not None and not isinstance(c, (int, float)) and str(c).strip()]
-        keyword_hits = sum(
-            1 for c in str_cells if any(kw in str(c).lower() for kw in PAYROLL_KEYWORDS)
-        )
+        str_cells = [
+            s.lower() for s in (str(c).strip() for c in row if c is not None and not isinstance(c, (int, float))) if s
+        ]
+        keyword_hits = sum(1 for c in str_cells if any(kw in c for kw in _PAYROLL_KEYWORDS))
         score = keyword_hits * 3 + len(str_cells)
         if score > best_score:
+            if keyword_hits >= 3:
+                return i
             best_score = score
             best_idx = i
 
@@ -255,29 +319,33 @@ def _is_data_row(row: tuple) -> bool:
 
 
 def parse_xlsx_payroll(content: bytes, db: Session, org_id) -> dict:
+    openpyxl = _optional_import("openpyxl")
     if openpyxl is None:
         logger.error("openpyxl not installed — cannot parse .xlsx files")
         return {"entries": [], "total_gross": 0, "total_deductions": 0, "total_net": 0, "unmatched_names": [], "error": "openpyxl not installed"}
 
     wb = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
-    ws = wb.active
-    rows = list(ws.iter_rows(values_only=True))
-    wb.close()
-
-    if not rows:
-        return {"entries": [], "total_gross": 0, "total_deductions": 0, "total_net": 0, "unmatched_names": []}
-
-    header_idx = _find_header_row(rows)
-    headers = _build_combined_headers(rows, header_idx)
-
-    entries = []
-    for row in rows[header_idx + 1:]:
-        if not _is_data_row(row):
-            continue
-        normed = {headers[i]: row[i] for i in range(len(headers)) if i < len(row)}
-        entry = _row_to_entry(normed)
-        if entry:
-            entries.append(entry)
+    try:
+        ws = wb.active
+        # Stream the sheet: only the rows scanned for the header are buffered.
+        it = ws.iter_rows(values_only=True)
+        head = list(islice(it, 15))
+
+        if not head:
+            return {"entries": [], "total_gross": 0, "total_deductions": 0, "total_net": 0, "unmatched_names": []}
+
+        header_idx = _find_header_row(head)
+        schema = _resolve_schema(_build_combined_headers(head, header_idx))
+
+        entries = []
+        for row in chain(head[header_idx + 1:], it):
+            if not _is_data_row(row):
+                continue
+            entry = _row_to_entry(row, schema)
+            if entry:
+                entries.append(entry)
+    finally:
+        wb.close()
 
     entries = _match_employees(entries, db, org_id)
     return _build_summary(entries)
@@ -288,6 +356,7 @@ def parse_xlsx_payroll(content: bytes, db: Session, org_id) -> dict:
 # ----------------------------
 
 def parse_xls_payroll(content: bytes, db: Session, org_id) -> dict:
+    xlrd = _optional_import("xlrd")
     if xlrd is None:
         logger.error("xlrd not installed — cannot parse .xls files")
         return {"entries": [], "total_gross": 0, "total_deductions": 0, "total_net": 0, "unmatched_names": [], "error": "xlrd not installed"}
@@ -298,11 +367,10 @@ def parse_xls_payroll(content: bytes, db: Session, org_id) -> dict:
     if sheet.nrows < 1:
         return {"entries": [], "total_gross": 0, "total_deductions": 0, "total_net": 0, "unmatched_names": []}
 
-    headers = [_normalize_header(sheet.cell_value(0, c)) for c in range(sheet.ncols)]
+    schema = _resolve_schema([_normalize_header(sheet.cell_value(0, c)) for c in range(sheet.ncols)])
     entries = []
     for r in range(1, sheet.nrows):
-        normed = {headers[c]: sheet.cell_value(r, c) for c in range(sheet.ncols)}
-        entry = _row_to_entry(normed)
+        entry = _row_to_entry(sheet.row_values(r), schema)
         if entry:
             entries.append(entry)
 
@@ -315,6 +383,7 @@ def parse_xls_payroll(content: bytes, db: Session, org_id) -> dict:
 # ----------------------------
 
 def parse_docx_payroll(content: bytes, db: Session, org_id) -> dict:
+    docx = _optional_import("docx")
     if docx is None:
         logger.error("python-docx not installed — cannot parse .docx files")
         return {"entries": [], "total_gross": 0, "total_deductions": 0, "total_net": 0, "unmatched_names": [], "error": "python-docx not installed"}
@@ -330,11 +399,11 @@ def parse_docx_payroll(content: bytes, db: Session, org_id) -> dict:
         headers = [_normalize_header(cell.text) for cell in rows[0].cells]
         if not any(headers):
             continue
+        schema = _resolve_schema(headers)
 
         for r in rows[1:]:
             values = [cell.text.strip() for cell in r.cells]
-            normed = {headers[i]: values[i] for i in range(min(len(headers), len(values)))}
-            entry = _row_to_entry(normed)
+            entry = _row_to_entry(values, schema)
             if entry:
                 entries.append(entry)
 
@@ -352,6 +421,7 @@ def parse_docx_payroll(content: bytes, db: Session, org_id) -> dict:
 # ----------------------------
 
 def parse_pdf_payroll(content: bytes, db: Session, org_id) -> dict:
+    pdfplumber = _optional_import("pdfplumber")
     if pdfplumber is None:
         logger.error("pdfplumber not installed — cannot parse .pdf files")
         return {"entries": [], "total_gross": 0, "total_deductions": 0, "total_net": 0, "unmatched_names": [], "error": "pdfplumber not installed"}
@@ -367,11 +437,11 @@ def parse_pdf_payroll(content: bytes, db: Session, org_id) -> dict:
                 headers = [_normalize_header(h) for h in tbl[0]]
                 if not any(headers):
                     continue
+                schema = _resolve_schema(headers)
                 for row in tbl[1:]:
                     if not row:
                         continue
-                    normed = {headers[i]: (row[i] if i < len(row) else None) for i in range(len(headers))}
-                    entry = _row_to_entry(normed)
+                    entry = _row_to_entry(row, schema)
                     if entry:
                         entries.append(entry)
 
@@ -389,6 +459,10 @@ def parse_pdf_payroll(content: bytes, db: Session, org_id) -> dict:
 # Best-effort fallback parsing
 # ----------------------------
 
+# Columns in extracted text are separated by runs of spaces or tabs.
+_COLUMN_GAP_RE = re.compile(r"\s{2,}|\t+")
+
+
 def _best_effort_parse_lines(text: str) -> list[dict]:
     """
     Tries to parse lines that look like:
@@ -403,12 +477,12 @@ def _best_effort_parse_lines(text: str) -> list[dict]:
             continue
 
         # Try comma-separated
-        if line.count(",") >= 3:
-            parts = [p.strip() for p in line.split(",")]
+        parts = line.split(",")
+        if len(parts) >= 4:
+            parts = [p.strip() for p in parts]
         else:
             # Try whitespace split with at least 4 components
-            parts = re.split(r"\s{2,}|\t+", line)
-            parts = [p.strip() for p in parts if p.strip()]
+            parts = [p.strip() for p in _COLUMN_GAP_RE.split(line) if p.strip()]
 
         if len(parts) < 4:
             continue
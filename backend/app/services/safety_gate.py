@@ -23,22 +23,34 @@ DIAGNOSTIC_PATTERNS = [
 ]
 
 
-def check_composed_content(steps: list[dict]) -> tuple[bool, list[str]]:
-    """Check adapted steps for unsafe content. Returns (is_safe, violations)."""
+_BLOCKED_LOWER = [(phrase, phrase.lower()) for phrase in BLOCKED_PHRASES]
+_DIAGNOSTIC_RES = [re.compile(pattern, re.IGNORECASE) for pattern in DIAGNOSTIC_PATTERNS]
+
+
+def check_composed_content(steps: list[dict], early_exit: bool = False) -> tuple[bool, list[str]]:
+    """Check adapted steps for unsafe content. Returns (is_safe, violations).
+
+    With ``early_exit`` the scan stops at the first violation, so only that
+    one is reported.
+    """
     violations = []
 
     for i, step in enumerate(steps):
         message = step.get("message", "").lower()
 
         # Check blocked phrases
-        for phrase in BLOCKED_PHRASES:
-            if phrase.lower() in message:
+        for phrase, lowered in _BLOCKED_LOWER:
+            if lowered in message:
                 violations.append(f"Step {i}: blocked phrase '{phrase}'")
+                if early_exit:
+                    return False, violations
 
         # Check diagnostic language
-        for pattern in DIAGNOSTIC_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
+        for pattern in _DIAGNOSTIC_RES:
+            if pattern.search(message):
                 violations.append(f"Step {i}: diagnostic language detected")
+                if early_exit:
+                    return False, violations
 
     is_safe = len(violations) == 0
     return is_safe, violations
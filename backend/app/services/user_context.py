@@ -794,16 +794,17 @@ def _build_kb_context(db: Session, org_id: uuid.UUID, user_message: str) -> str:
     if not user_message:
         return ""
     try:
-        from app.services.knowledge_search import search_chunks, format_kb_context
-        from app.models.document import Document
+        from app.services.knowledge_search import (
+            format_kb_context,
+            load_documents_for_chunks,
+            search_chunks,
+        )
 
         chunks = search_chunks(db, org_id, user_message, limit=6)
         if not chunks:
             return ""
 
-        doc_ids = list({c["document_id"] for c in chunks})
-        docs = db.query(Document).filter(Document.id.in_(doc_ids)).all()
-        doc_map = {d.id: d for d in docs}
+        doc_map = load_documents_for_chunks(db, chunks)
         return format_kb_context(chunks, doc_map) or ""
     except Exception as e:
         logger.debug("KB context build skipped: %s", e)
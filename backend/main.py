@@ -1,19 +1,21 @@
 from fastapi import FastAPI, HTTPException, UploadFile, File
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from contextlib import asynccontextmanager
 from pathlib import Path
 from PIL import Image
 from openai import OpenAI
 from sqlalchemy import text
 
+import anyio
 import json
 import os
 import base64
 import logging
 from dotenv import load_dotenv
-from app.database import engine
-from app.config import app_env
+from app.database import DB_MAX_OVERFLOW, DB_POOL_SIZE, engine
+from app.config import app_env, is_development_like
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -54,7 +56,28 @@ if _sentry_dsn:
     except ImportError:
         logger.warning("SENTRY_DSN set but sentry_sdk not installed. Add sentry-sdk to requirements.txt and redeploy.")
 
-app = FastAPI(title="Rafiki API")
+# Sync (def) endpoints share anyio's worker threadpool, 40 threads by default.
+# Long LLM calls and manager reports hold a thread for seconds, so size it
+# explicitly — to the DB pool by default, since nearly every handler holds a
+# connection and threads beyond the pool would just queue in QueuePool.
+DB_POOL_CAPACITY = DB_POOL_SIZE + DB_MAX_OVERFLOW
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", str(DB_POOL_CAPACITY)))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if THREADPOOL_SIZE > DB_POOL_CAPACITY:
+        logger.warning(
+            "THREADPOOL_SIZE=%d exceeds the DB pool (DB_POOL_SIZE + DB_MAX_OVERFLOW = %d); "
+            "requests may time out waiting for a connection",
+            THREADPOOL_SIZE, DB_POOL_CAPACITY,
+        )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    yield
+
+
+# orjson encodes the UUID/datetime-heavy list payloads in C.
+app = FastAPI(title="Rafiki API", default_response_class=ORJSONResponse, lifespan=lifespan)
 
 # --------------------
 # CORS (FIXED + ROBUST)
@@ -85,6 +108,37 @@ app.add_middleware(
     max_age=86400,
 )
 
+# --------------------
+# Dev aid: flag requests that issue too many SQL statements (N+1 hunting)
+# --------------------
+_SQL_QUERY_WARN_THRESHOLD = int(os.getenv("SQL_QUERY_WARN_THRESHOLD", "0") or 0)
+if _SQL_QUERY_WARN_THRESHOLD > 0 and is_development_like():
+    from contextvars import ContextVar
+    from sqlalchemy import event
+    from fastapi import Request
+
+    _request_query_count: ContextVar[list | None] = ContextVar("request_query_count", default=None)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _count_query(conn, cursor, statement, parameters, context, executemany):
+        counter = _request_query_count.get()
+        if counter is not None:
+            counter[0] += 1
+
+    @app.middleware("http")
+    async def _warn_on_query_count(request: Request, call_next):
+        counter = [0]
+        token = _request_query_count.set(counter)
+        try:
+            return await call_next(request)
+        finally:
+            _request_query_count.reset(token)
+            if counter[0] > _SQL_QUERY_WARN_THRESHOLD:
+                logger.warning(
+                    "%s %s issued %d SQL statements (threshold %d) — possible N+1",
+                    request.method, request.url.path, counter[0], _SQL_QUERY_WARN_THRESHOLD,
+                )
+
 # --------------------
 # Routers
 # --------------------
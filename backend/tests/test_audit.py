@@ -0,0 +1,105 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy.exc import OperationalError
+
+from app.services import audit
+from app.services.audit import AuditBuffer, _serialize_details, _to_uuid, log_action
+
+
+def test_to_uuid_accepts_uuid_and_string_forms():
+    u = uuid.uuid4()
+
+    assert _to_uuid(u) is u
+    assert _to_uuid(str(u)) == u
+    assert _to_uuid(u.hex) == u
+    assert _to_uuid(None) is None
+
+
+def test_to_uuid_rejects_garbage():
+    assert _to_uuid("not-a-uuid") is None
+    assert _to_uuid(12345) is None
+
+
+def test_serialize_details_stringifies_non_json_values():
+    u = uuid.uuid4()
+    details = {"id": u, "ids": (u, 1), "nested": {"when": datetime(2026, 1, 2, 3, 4, 5)}, 7: "x"}
+
+    assert _serialize_details(details) == {
+        "id": str(u),
+        "ids": [str(u), 1],
+        "nested": {"when": "2026-01-02T03:04:05"},
+        "7": "x",
+    }
+    assert _serialize_details(None) is None
+
+
+class _FakeSession:
+    def __init__(self, log):
+        self.log = log
+
+    def execute(self, statement, params=None):
+        if params is not None:
+            self.log.append(list(params))
+
+    def commit(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def test_audit_buffer_writes_batches(monkeypatch):
+    written = []
+    buffer = AuditBuffer(lambda: _FakeSession(written), max_size=100, flush_interval=3600)
+    monkeypatch.setattr(audit, "_buffer", buffer)
+    org_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+    log_action(None, org_id, user_id, "create", "thing", 1)
+    log_action(None, org_id, user_id, "update", "thing", 1, {"field": "name"})
+    assert written == [] and len(buffer) == 2
+
+    assert buffer.flush() == 2
+    assert [[e["action"] for e in batch] for batch in written] == [["create", "update"]]
+    assert buffer.flush() == 0
+
+
+def test_rows_read_back_by_the_app_skip_the_buffer(monkeypatch):
+    buffer = AuditBuffer(lambda: None, max_size=100, flush_interval=3600)
+    monkeypatch.setattr(audit, "_buffer", buffer)
+    written = []
+    org_id, user_id = uuid.uuid4(), uuid.uuid4()
+
+    log_action(_FakeSession(written), org_id, user_id, "distribute", "payroll_batch", 1)
+    log_action(_FakeSession(written), org_id, user_id, "view", "manager_team", None)
+    log_action(_FakeSession(written), org_id, user_id, "approve", "payroll_batch", 1)
+
+    assert [[e["action"] for e in batch] for batch in written] == [["distribute"], ["view"]]
+    assert len(buffer) == 1
+
+
+class _DownSession(_FakeSession):
+    def execute(self, statement, params=None):
+        if params is not None:
+            raise OperationalError("INSERT", params, Exception("connection refused"))
+
+    def rollback(self):
+        pass
+
+
+def test_audit_buffer_keeps_newest_rows_while_database_is_down():
+    buffer = AuditBuffer(lambda: _DownSession([]), max_size=100, flush_interval=3600, max_backlog=3)
+    for i in range(2):
+        buffer.add({"action": i})
+
+    assert buffer.flush() == 0
+    assert len(buffer) == 2
+
+    for i in range(2, 5):
+        buffer.add({"action": i})
+
+    assert len(buffer) == 3 and buffer.dropped == 2
+    written = []
+    buffer.session_factory = lambda: _FakeSession(written)
+    assert buffer.flush() == 3
+    assert [[e["action"] for e in batch] for batch in written] == [[2, 3, 4]]
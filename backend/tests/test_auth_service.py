@@ -52,3 +52,37 @@ def test_development_mode_uses_safe_dev_secret(monkeypatch):
 
     assert payload is not None
     assert payload["sub"] == "demo-user"
+
+
+def test_verify_password_caches_successes_only(monkeypatch):
+    auth = _reload_auth(monkeypatch)
+    calls = []
+    check = auth._check_password
+    monkeypatch.setattr(auth, "_check_password", lambda p, h: calls.append(p) or check(p, h))
+
+    stored = "salt$" + auth.hashlib.sha256(b"saltpw").hexdigest()
+    assert auth.verify_password("pw", stored)
+    assert auth.verify_password("pw", stored)
+    assert not auth.verify_password("wrong", stored)
+    assert not auth.verify_password("wrong", stored)
+
+    assert calls == ["pw", "wrong", "wrong"]
+
+
+def test_decode_access_token_cache_honours_exp(monkeypatch):
+    auth = _reload_auth(monkeypatch)
+    token = auth.create_access_token({"sub": "user-123"})
+    payload = auth.decode_access_token(token)
+
+    monkeypatch.setattr(auth.jwt, "decode", lambda *a, **k: pytest.fail("cache miss"))
+    assert auth.decode_access_token(token) == payload
+
+    monkeypatch.setattr(auth.time, "time", lambda: payload["exp"] + 1)
+    assert auth.decode_access_token(token) is None
+
+
+def test_needs_rehash_flags_legacy_hashes_only(monkeypatch):
+    auth = _reload_auth(monkeypatch)
+
+    assert auth.needs_rehash("salt$" + "ab" * 32)
+    assert not auth.needs_rehash("$2b$12$" + "x" * 53)
@@ -0,0 +1,66 @@
+from app.services import cache as cache_mod
+from app.services.cache import TTLCache
+
+
+def test_get_set_and_pop():
+    c = TTLCache(maxsize=4, ttl=60)
+    c.set("a", [1, 2])
+
+    assert c.get("a") == [1, 2]
+    assert c.get("missing") is None
+    assert c.get("missing", "default") == "default"
+
+    c.pop("a")
+    assert c.get("a") is None
+
+
+def test_entries_expire(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    c = TTLCache(maxsize=4, ttl=10)
+    c.set("a", 1)
+
+    now[0] += 9
+    assert c.get("a") == 1
+    now[0] += 2
+    assert c.get("a") is None
+    assert len(c) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    c = TTLCache(maxsize=2, ttl=60)
+    c.set("a", 1)
+    c.set("b", 2)
+    c.get("a")
+    c.set("c", 3)
+
+    assert c.get("a") == 1
+    assert c.get("b") is None
+    assert c.get("c") == 3
+
+
+def test_keep_stale_serves_expired_values(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    c = TTLCache(maxsize=4, ttl=10, keep_stale=True)
+    c.set("a", 1)
+
+    now[0] += 11
+    assert c.get("a") is None
+    assert c.get_stale("a") == 1
+
+    c.pop("a")
+    assert c.get_stale("a") is None
+
+
+def test_pop_where_drops_only_matching_keys():
+    c = TTLCache(maxsize=10, ttl=60)
+    c.set(("org-a", "nurse"), 1)
+    c.set(("org-a", None), 2)
+    c.set(("org-b", "nurse"), 3)
+
+    c.pop_where(lambda key: key[0] == "org-a")
+
+    assert c.get(("org-a", "nurse")) is None
+    assert c.get(("org-a", None)) is None
+    assert c.get(("org-b", "nurse")) == 3
@@ -398,10 +398,11 @@ function SidebarMessages({ onUnreadChange, onConvoChange }) {
         </div>
         <div className="emp-msg-thread">
           {thread.map(m => {
-            const sender = activeConvo.participants?.find(p => p.id === m.sender_id);
+            const senderIdx = activeConvo.participant_ids?.indexOf(m.sender_id) ?? -1;
+            const senderName = senderIdx >= 0 ? activeConvo.participant_names[senderIdx] : null;
             return (
               <div key={m.id} className={`emp-msg-bubble ${m.sender_id === myId ? "mine" : "theirs"}`}>
-                {activeConvo.is_group && m.sender_id !== myId && <div className="emp-msg-sender">{sender?.name || "Unknown"}</div>}
+                {activeConvo.is_group && m.sender_id !== myId && <div className="emp-msg-sender">{senderName || "Unknown"}</div>}
                 <SidebarMessageContent content={m.content} onAction={() => loadThread(activeConvo.id)} />
                 <div className="emp-msg-time">{fmtTime(m.created_at)}</div>
               </div>
@@ -245,9 +245,23 @@ export default function ManagerTimesheets() {
   const load = async () => {
     setLoading(true);
     try {
-      let res = await authFetch(`${API}/api/v1/timesheets/admin/all?start=${fmtDate(weekStart)}&end=${fmtDate(weekEnd)}`);
-      if (!res.ok) res = await authFetch(`${API}/api/v1/timesheets/team?start=${fmtDate(weekStart)}&end=${fmtDate(weekEnd)}`);
-      if (res.ok) setEntries(await res.json());
+      const res = await authFetch(`${API}/api/v1/timesheets/admin/all?start=${fmtDate(weekStart)}&end=${fmtDate(weekEnd)}`);
+      if (res.ok) {
+        const data = await res.json();
+        setEntries(Array.isArray(data) ? data : (data.items || []));
+        return;
+      }
+      // /team is paginated — follow next_cursor until every page is in.
+      const all = [];
+      let cursor = null;
+      do {
+        const page = await authFetch(`${API}/api/v1/timesheets/team?start=${fmtDate(weekStart)}&end=${fmtDate(weekEnd)}&page_size=200${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ""}`);
+        if (!page.ok) return;
+        const data = await page.json();
+        all.push(...(data.items || []));
+        cursor = data.next_cursor;
+      } while (cursor);
+      setEntries(all);
     } finally { setLoading(false); }
   };
 